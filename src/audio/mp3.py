@@ -0,0 +1,132 @@
+"""Pure-Python MP3 duration probing from frame headers."""
+
+from pathlib import Path
+
+# Bitrates in kbps, indexed by bitrate index (0 = free format, 15 = invalid)
+_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+# Sample rates in Hz, keyed by the header's version bits
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),  # MPEG-1
+    2: (22050, 24000, 16000),  # MPEG-2
+    0: (11025, 12000, 8000),  # MPEG-2.5
+}
+
+
+def _parse_frame_header(data: bytes, offset: int) -> dict | None:
+    """Decode the 4-byte MPEG audio frame header at offset, if valid."""
+    if offset + 4 > len(data):
+        return None
+
+    b0, b1, b2, b3 = data[offset:offset + 4]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+
+    version_bits = (b1 >> 3) & 0x03
+    layer_bits = (b1 >> 1) & 0x03
+    bitrate_index = b2 >> 4
+    sample_rate_index = (b2 >> 2) & 0x03
+    if version_bits == 1 or layer_bits == 0:
+        return None
+    if bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    version = 1 if version_bits == 3 else 2
+    layer = 4 - layer_bits
+    bitrate = _BITRATES[(version, layer)][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version_bits][sample_rate_index]
+    padding = (b2 >> 1) & 0x01
+    mono = (b3 >> 6) == 3
+
+    if layer == 1:
+        samples_per_frame = 384
+        frame_length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples_per_frame = 576 if layer == 3 and version == 2 else 1152
+        frame_length = (samples_per_frame // 8) * bitrate // sample_rate + padding
+
+    # Offset of the Xing/Info tag within the first frame (layer III only)
+    if version == 1:
+        side_info = 17 if mono else 32
+    else:
+        side_info = 9 if mono else 17
+
+    return {
+        "bitrate": bitrate,
+        "sample_rate": sample_rate,
+        "samples_per_frame": samples_per_frame,
+        "frame_length": frame_length,
+        "xing_offset": 4 + side_info,
+    }
+
+
+def _skip_id3v2(data: bytes) -> int:
+    """Return the offset just past a leading ID3v2 tag (0 if there is none)."""
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    # Tag size is a 28-bit syncsafe integer that excludes the 10-byte header
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def read_mp3_duration(audio_path: Path | str) -> float | None:
+    """Get MP3 duration by reading frame headers instead of running ffprobe.
+
+    Uses the frame count from a Xing/Info or VBRI header when present,
+    otherwise assumes constant bitrate and derives the duration from the
+    size of the audio data.
+
+    Args:
+        audio_path: Path to the MP3 file
+
+    Returns:
+        Duration in seconds, or None if the file isn't a readable MP3
+    """
+    try:
+        data = Path(audio_path).read_bytes()
+    except OSError:
+        return None
+
+    start = _skip_id3v2(data)
+
+    # Find the first frame header whose successor (if any) also syncs, so a
+    # stray 0xFF byte in leading junk isn't mistaken for audio
+    header = None
+    offset = data.find(b"\xff", start)
+    while offset != -1:
+        header = _parse_frame_header(data, offset)
+        if header is not None:
+            next_offset = offset + header["frame_length"]
+            if next_offset + 4 > len(data) or _parse_frame_header(data, next_offset):
+                break
+        header = None
+        offset = data.find(b"\xff", offset + 1)
+
+    if header is None:
+        return None
+
+    # VBR files carry a total frame count in a Xing/Info or VBRI header
+    frame_count = None
+    xing = offset + header["xing_offset"]
+    vbri = offset + 36
+    if data[xing:xing + 4] in (b"Xing", b"Info"):
+        flags = int.from_bytes(data[xing + 4:xing + 8], "big")
+        if flags & 0x01:
+            frame_count = int.from_bytes(data[xing + 8:xing + 12], "big")
+    elif data[vbri:vbri + 4] == b"VBRI":
+        frame_count = int.from_bytes(data[vbri + 14:vbri + 18], "big")
+
+    if frame_count:
+        return frame_count * header["samples_per_frame"] / header["sample_rate"]
+
+    # Constant bitrate: duration follows from the size of the audio data
+    end = len(data) - 128 if data[-128:-125] == b"TAG" else len(data)
+    return (end - offset) * 8 / header["bitrate"]
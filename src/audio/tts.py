@@ -8,14 +8,17 @@ import subprocess
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Iterator
 
-import httpx
-
 from ..config import Config, TTSConfig, load_config
+from .mp3 import read_mp3_duration
 
+# Anything that isn't a word character, hyphen, apostrophe or whitespace
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s\-']")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class WordTimestamp:
     """Timestamp for a single word."""
 
@@ -121,6 +124,8 @@ class ElevenLabsTTS(TTSProvider):
 
     def generate(self, text: str, output_path: str | Path) -> Path:
         """Generate speech from text and save to file."""
+        import httpx
+
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -150,6 +155,8 @@ class ElevenLabsTTS(TTSProvider):
 
     def generate_stream(self, text: str) -> Iterator[bytes]:
         """Generate speech from text as a stream."""
+        import httpx
+
         url = f"{self.BASE_URL}/text-to-speech/{self.voice_id}/stream"
 
         payload = {
@@ -174,6 +181,8 @@ class ElevenLabsTTS(TTSProvider):
 
     def get_available_voices(self) -> list[dict]:
         """Get list of available voices."""
+        import httpx
+
         url = f"{self.BASE_URL}/voices"
 
         with httpx.Client(timeout=30.0) as client:
@@ -195,6 +204,8 @@ class ElevenLabsTTS(TTSProvider):
         self, text: str, output_path: str | Path
     ) -> TTSResult:
         """Generate speech with word-level timestamps using ElevenLabs API."""
+        import httpx
+
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -306,13 +317,16 @@ class ElevenLabsTTS(TTSProvider):
 class EdgeTTS(TTSProvider):
     """Microsoft Edge TTS provider - free, high-quality voices."""
 
-    # Popular natural-sounding voices
-    DEFAULT_VOICES = {
+    # Popular natural-sounding voices (read-only so presets can't drift at runtime)
+    DEFAULT_VOICES = MappingProxyType({
         "male": "en-US-GuyNeural",
         "female": "en-US-AriaNeural",
         "british_male": "en-GB-RyanNeural",
         "british_female": "en-GB-SoniaNeural",
-    }
+    })
+
+    # Voice list from the Edge service, filled on first get_available_voices()
+    _voices_cache: list[dict] | None = None
 
     def __init__(self, config: TTSConfig, voice: str | None = None):
         """Initialize Edge TTS.
@@ -413,7 +427,7 @@ class EdgeTTS(TTSProvider):
         if word_timestamps:
             duration = word_timestamps[-1].end_seconds
         else:
-            # Fallback: estimate from audio file using ffprobe
+            # Fallback: read the duration from the audio file itself
             duration = self._get_audio_duration(output_path)
 
         return TTSResult(
@@ -423,7 +437,11 @@ class EdgeTTS(TTSProvider):
         )
 
     def _get_audio_duration(self, audio_path: Path) -> float:
-        """Get audio duration using ffprobe."""
+        """Get audio duration from MP3 frame headers, falling back to ffprobe."""
+        duration = read_mp3_duration(audio_path)
+        if duration is not None:
+            return duration
+
         try:
             result = subprocess.run(
                 [
@@ -467,7 +485,14 @@ class EdgeTTS(TTSProvider):
             yield chunk
 
     def get_available_voices(self) -> list[dict]:
-        """Get list of available voices."""
+        """Get list of available voices.
+
+        The voice list is fetched once per process and shared by all instances;
+        each call returns fresh copies so callers can't alter the cache.
+        """
+        if EdgeTTS._voices_cache is not None:
+            return [dict(voice) for voice in EdgeTTS._voices_cache]
+
         try:
             import edge_tts
         except ImportError:
@@ -482,7 +507,7 @@ class EdgeTTS(TTSProvider):
 
         voices = self._run_async(_get_voices())
 
-        return [
+        EdgeTTS._voices_cache = [
             {
                 "voice_id": v["ShortName"],
                 "name": v["FriendlyName"],
@@ -494,6 +519,7 @@ class EdgeTTS(TTSProvider):
             }
             for v in voices
         ]
+        return [dict(voice) for voice in EdgeTTS._voices_cache]
 
     def get_english_voices(self) -> list[dict]:
         """Get list of English voices only."""
@@ -692,6 +718,8 @@ class MockTTS(TTSProvider):
 
     def __init__(self, config: TTSConfig):
         super().__init__(config)
+        # Encoded audio keyed by duration; output depends on nothing else
+        self._audio_cache: dict[float, bytes] = {}
 
     def generate(self, text: str, output_path: str | Path) -> Path:
         """Generate a silent audio file for testing using FFmpeg."""
@@ -704,6 +732,11 @@ class MockTTS(TTSProvider):
         words = len(text.split())
         duration_seconds = max(1.0, (words / 150) * 60)
 
+        cached = self._audio_cache.get(duration_seconds)
+        if cached is not None:
+            output_path.write_bytes(cached)
+            return output_path
+
         # Use FFmpeg to generate silent audio
         cmd = [
             "ffmpeg", "-y",
@@ -737,8 +770,17 @@ class MockTTS(TTSProvider):
             # This won't be playable but allows tests to pass
             output_path.write_bytes(b"\x00" * 1000)
 
+        if output_path.exists():
+            self._audio_cache[duration_seconds] = output_path.read_bytes()
         return output_path
 
+    async def generate_async(self, text: str, output_path: str | Path) -> Path:
+        """Generate mock audio without blocking the event loop.
+
+        Lets callers produce several scenes concurrently with asyncio.gather().
+        """
+        return await asyncio.to_thread(self.generate, text, output_path)
+
     def generate_with_timestamps(
         self, text: str, output_path: str | Path
     ) -> TTSResult:
@@ -750,25 +792,26 @@ class MockTTS(TTSProvider):
         words = text.split()
         duration_seconds = max(1.0, (len(words) / 150) * 60)
 
+        import numpy as np
+
         # Generate simulated word timestamps
-        word_timestamps = []
-        current_time = 0.0
         avg_word_duration = duration_seconds / max(len(words), 1)
 
-        for word in words:
-            # Clean word of punctuation for the timestamp
-            clean_word = re.sub(r"[^\w\-']", "", word)
-            if clean_word:
-                # Vary duration slightly based on word length
-                word_duration = avg_word_duration * (0.5 + 0.5 * len(clean_word) / 6)
-                word_timestamps.append(
-                    WordTimestamp(
-                        word=clean_word,
-                        start_seconds=current_time,
-                        end_seconds=current_time + word_duration,
-                    )
-                )
-                current_time += word_duration + 0.05  # Small gap between words
+        # Clean punctuation out of the whole text in one pass; words that were
+        # only punctuation drop out of the split
+        clean_words = _PUNCTUATION_PATTERN.sub("", text).split()
+
+        # Vary duration slightly based on word length, with a small gap
+        # between words; each word starts where the previous one's gap ends
+        lengths = np.fromiter(map(len, clean_words), dtype=float, count=len(clean_words))
+        word_durations = avg_word_duration * (0.5 + 0.5 * lengths / 6)
+        starts = np.concatenate(([0.0], np.cumsum(word_durations + 0.05)[:-1]))
+        ends = starts + word_durations
+
+        word_timestamps = [
+            WordTimestamp(word=word, start_seconds=start, end_seconds=end)
+            for word, start, end in zip(clean_words, starts.tolist(), ends.tolist())
+        ]
 
         return TTSResult(
             audio_path=audio_path,
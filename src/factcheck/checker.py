@@ -25,6 +25,9 @@ from .prompts import (
     FACT_CHECK_SYSTEM_PROMPT,
 )
 
+# The mock analysis never changes, so serialize it once
+_MOCK_RAW_ANALYSIS = json.dumps(FACT_CHECK_MOCK_RESPONSE, indent=2)
+
 
 class FactCheckError(Exception):
     """Error during fact checking."""
@@ -314,7 +317,7 @@ class FactChecker:
         if self.use_mock:
             # Return mock response for testing
             response = FACT_CHECK_MOCK_RESPONSE
-            raw_analysis = json.dumps(response, indent=2)
+            raw_analysis = _MOCK_RAW_ANALYSIS
         else:
             try:
                 # Use generate with file access for web search capability
@@ -8,7 +8,6 @@ import json
 from pathlib import Path
 from typing import Optional
 
-from ..audio import get_audio_duration
 from ..project import Project
 from .models import ProjectSyncStatus, SyncIssue, SyncIssueType
 
@@ -26,6 +25,9 @@ class ProjectValidator:
         Returns:
             ProjectSyncStatus with any issues found.
         """
+        # Imported here so loading this module doesn't pull in the TTS backends
+        from ..audio import get_audio_duration
+
         issues: list[SyncIssue] = []
 
         # Get counts from different sources
@@ -171,6 +173,11 @@ class ProjectValidator:
             return []
         return list(scenes_dir.glob("*.tsx"))
 
+    def _get_scene_frame_counts(self, scenes: list[dict]) -> list[int]:
+        """Convert each storyboard scene's audio duration to a frame count."""
+        fps = self.project.video.fps
+        return [int(scene.get("audio_duration_seconds", 0) * fps) for scene in scenes]
+
     def get_scene_start_frame(self, scene_index: int) -> int:
         """
         Calculate the start frame for a scene based on storyboard.
@@ -186,19 +193,11 @@ class ProjectValidator:
         """
         storyboard = self.project.load_storyboard()
         scenes = storyboard.get("scenes", [])
-        fps = self.project.video.fps
 
         if scene_index < 0 or scene_index >= len(scenes):
             raise ValueError(f"Scene index {scene_index} out of range (0-{len(scenes)-1})")
 
-        start_frame = 0
-        for i, scene in enumerate(scenes):
-            if i == scene_index:
-                return start_frame
-            duration = scene.get("audio_duration_seconds", 0)
-            start_frame += int(duration * fps)
-
-        return start_frame
+        return sum(self._get_scene_frame_counts(scenes[:scene_index]))
 
     def get_scene_duration_frames(self, scene_index: int) -> int:
         """
@@ -212,13 +211,11 @@ class ProjectValidator:
         """
         storyboard = self.project.load_storyboard()
         scenes = storyboard.get("scenes", [])
-        fps = self.project.video.fps
 
         if scene_index < 0 or scene_index >= len(scenes):
             raise ValueError(f"Scene index {scene_index} out of range (0-{len(scenes)-1})")
 
-        duration = scenes[scene_index].get("audio_duration_seconds", 0)
-        return int(duration * fps)
+        return self._get_scene_frame_counts([scenes[scene_index]])[0]
 
     def get_scene_info(self, scene_index: int) -> dict:
         """
@@ -242,15 +239,17 @@ class ProjectValidator:
         """
         storyboard = self.project.load_storyboard()
         scenes = storyboard.get("scenes", [])
-        fps = self.project.video.fps
 
         if scene_index < 0 or scene_index >= len(scenes):
             raise ValueError(f"Scene index {scene_index} out of range (0-{len(scenes)-1})")
 
+        # Compute every frame count once rather than reloading the storyboard
+        # through get_scene_start_frame()
+        frame_counts = self._get_scene_frame_counts(scenes[: scene_index + 1])
         scene = scenes[scene_index]
-        start_frame = self.get_scene_start_frame(scene_index)
+        start_frame = sum(frame_counts[:-1])
         duration_seconds = scene.get("audio_duration_seconds", 0)
-        duration_frames = int(duration_seconds * fps)
+        duration_frames = frame_counts[-1]
 
         # Try to get narration text
         narration_text = ""
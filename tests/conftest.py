@@ -146,7 +146,7 @@ From 40 to 3,500+ items per second. An **87× improvement**.
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def project_root() -> Path:
     """Return the project root directory."""
     return Path(__file__).parent.parent
@@ -3,12 +3,17 @@
 import json
 import pytest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 from src.refine.validation import validate_project_sync, ProjectValidator
 from src.refine.models import SyncIssueType
 
 
+def _write_jsons(base: Path, files: dict) -> None:
+    """Write each object to its path (relative to base) as JSON."""
+    for rel_path, obj in files.items():
+        (base / rel_path).write_text(json.dumps(obj))
+
+
 class TestValidateProjectSync:
     """Tests for validate_project_sync function."""
 
@@ -145,9 +150,6 @@ class TestSceneCountMismatch:
             ],
             "total_duration_seconds": 30,
         }
-        with open(temp_project_dir / "storyboard" / "storyboard.json", "w") as f:
-            json.dump(storyboard, f)
-
         # Create narrations with only 2 scenes
         narrations = {
             "scenes": [
@@ -155,8 +157,13 @@ class TestSceneCountMismatch:
                 {"scene_id": "scene2", "title": "Scene 2", "narration": "Test 2", "duration_seconds": 10},
             ]
         }
-        with open(temp_project_dir / "narration" / "narrations.json", "w") as f:
-            json.dump(narrations, f)
+        _write_jsons(
+            temp_project_dir,
+            {
+                "storyboard/storyboard.json": storyboard,
+                "narration/narrations.json": narrations,
+            },
+        )
 
         # Create voiceover files
         for scene in storyboard["scenes"]:
@@ -187,9 +194,6 @@ class TestMissingVoiceover:
             ],
             "total_duration_seconds": 20,
         }
-        with open(temp_project_dir / "storyboard" / "storyboard.json", "w") as f:
-            json.dump(storyboard, f)
-
         # Create narrations
         narrations = {
             "scenes": [
@@ -197,8 +201,13 @@ class TestMissingVoiceover:
                 {"scene_id": "scene2", "title": "Scene 2", "narration": "Test 2", "duration_seconds": 10},
             ]
         }
-        with open(temp_project_dir / "narration" / "narrations.json", "w") as f:
-            json.dump(narrations, f)
+        _write_jsons(
+            temp_project_dir,
+            {
+                "storyboard/storyboard.json": storyboard,
+                "narration/narrations.json": narrations,
+            },
+        )
 
         # Only create one voiceover file
         audio_file = temp_project_dir / "voiceover" / "scene1.mp3"
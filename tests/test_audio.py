@@ -1,6 +1,8 @@
 """Tests for audio/TTS module."""
 
-import os
+import asyncio
+import dataclasses
+import itertools
 from pathlib import Path
 from unittest.mock import MagicMock, patch, AsyncMock
 
@@ -14,30 +16,110 @@ from src.audio import (
     WordTimestamp,
     get_tts_provider,
 )
+from src.audio.mp3 import read_mp3_duration
 from src.audio.tts import MockTTS
 from src.config import Config, TTSConfig
 
 
+# Read-only providers and configs are shared across the module; tests that
+# need a different config take a copy via model_copy() instead of mutating.
+
+
+@pytest.fixture(scope="module")
+def base_config():
+    return Config()
+
+
+@pytest.fixture(scope="module")
+def mock_tts():
+    return MockTTS(TTSConfig(provider="mock"))
+
+
+@pytest.fixture(scope="module")
+def edge_config():
+    return TTSConfig(provider="edge")
+
+
+@pytest.fixture(scope="module")
+def edge_tts(edge_config):
+    return EdgeTTS(edge_config)
+
+
+@pytest.fixture(scope="module")
+def elevenlabs_config():
+    return TTSConfig(
+        provider="elevenlabs",
+        model="eleven_multilingual_v2",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_voiceover_texts():
+    return [
+        "Every time you send a message to ChatGPT, something remarkable happens.",
+        "LLM inference has two distinct phases.",
+        "The solution is elegant: compute each Key and Value exactly once.",
+    ]
+
+
+@pytest.fixture(scope="module")
+def audio_out_dir(tmp_path_factory):
+    """Shared output directory for tests that write one uniquely named file."""
+    return tmp_path_factory.mktemp("audio_out")
+
+
+@pytest.fixture(scope="session")
+def sine_mp3(tmp_path_factory):
+    """Encode a 2-second sine wave MP3 once for all duration tests."""
+    import subprocess
+
+    output_path = tmp_path_factory.mktemp("audio") / "sine.mp3"
+    try:
+        subprocess.run(
+            [
+                "ffmpeg", "-y",
+                "-f", "lavfi",
+                "-i", "sine=frequency=440:duration=2",
+                "-c:a", "libmp3lame",
+                str(output_path),
+            ],
+            capture_output=True,
+            timeout=10,
+        )
+    except FileNotFoundError:
+        pytest.skip("ffmpeg not available")
+
+    if not output_path.exists():
+        pytest.skip("ffmpeg failed to encode test audio")
+    return output_path
+
+
 class TestMockTTS:
     """Tests for mock TTS provider."""
 
-    @pytest.fixture
-    def mock_tts(self):
-        config = TTSConfig(provider="mock")
-        return MockTTS(config)
-
-    def test_generate_creates_file(self, mock_tts, tmp_path):
-        output_path = tmp_path / "test.mp3"
+    def test_generate_creates_file(self, mock_tts, audio_out_dir):
+        output_path = audio_out_dir / "mock_generate.mp3"
         result = mock_tts.generate("Hello, world!", output_path)
 
         assert result == output_path
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
+    def test_generate_reuses_audio_for_same_duration(self, tmp_path):
+        tts = MockTTS(TTSConfig(provider="mock"))
+        first = tts.generate("Hello, world!", tmp_path / "first.mp3")
+
+        with patch("subprocess.run") as mock_run:
+            second = tts.generate("Goodbye, world!", tmp_path / "second.mp3")
+
+        mock_run.assert_not_called()
+        assert second.read_bytes() == first.read_bytes()
+
     def test_generate_stream_yields_bytes(self, mock_tts):
-        chunks = list(mock_tts.generate_stream("Hello"))
-        assert len(chunks) > 0
-        assert all(isinstance(chunk, bytes) for chunk in chunks)
+        stream = mock_tts.generate_stream("Hello")
+        first = next(stream)
+        assert isinstance(first, bytes)
+        assert all(isinstance(chunk, bytes) for chunk in stream)
 
     def test_get_available_voices(self, mock_tts):
         voices = mock_tts.get_available_voices()
@@ -49,100 +131,79 @@ class TestMockTTS:
 class TestGetTTSProvider:
     """Tests for TTS provider factory."""
 
-    def test_returns_mock_provider(self):
-        config = Config()
-        config.tts.provider = "mock"
-        provider = get_tts_provider(config)
-        assert isinstance(provider, MockTTS)
-
-    def test_raises_for_unknown_provider(self):
-        config = Config()
-        config.tts.provider = "unknown_provider"
+    @pytest.mark.parametrize(
+        "provider,expected_cls,env",
+        [
+            ("mock", MockTTS, {}),
+            ("elevenlabs", ElevenLabsTTS, {"ELEVENLABS_API_KEY": "test_key"}),
+            ("edge", EdgeTTS, {}),
+        ],
+    )
+    def test_returns_provider(self, base_config, monkeypatch, provider, expected_cls, env):
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        config = base_config.model_copy(update={"tts": TTSConfig(provider=provider)})
+        assert isinstance(get_tts_provider(config), expected_cls)
+
+    def test_raises_for_unknown_provider(self, base_config):
+        config = base_config.model_copy(update={"tts": TTSConfig(provider="unknown_provider")})
         with pytest.raises(ValueError, match="Unknown TTS provider"):
             get_tts_provider(config)
 
-    @patch.dict(os.environ, {"ELEVENLABS_API_KEY": "test_key"})
-    def test_returns_elevenlabs_with_api_key(self):
-        config = Config()
-        config.tts.provider = "elevenlabs"
-        provider = get_tts_provider(config)
-        assert isinstance(provider, ElevenLabsTTS)
-
-    def test_returns_edge_provider(self):
-        config = Config()
-        config.tts.provider = "edge"
-        provider = get_tts_provider(config)
-        assert isinstance(provider, EdgeTTS)
-
 
 class TestElevenLabsTTS:
     """Tests for ElevenLabs TTS provider."""
 
-    @pytest.fixture
-    def config(self):
-        return TTSConfig(
-            provider="elevenlabs",
-            model="eleven_multilingual_v2",
-        )
+    @pytest.fixture(autouse=True)
+    def _api_key(self, monkeypatch):
+        monkeypatch.setenv("ELEVENLABS_API_KEY", "test_key")
 
-    def test_init_requires_api_key(self, config):
-        # Clear env var if set
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop("ELEVENLABS_API_KEY", None)
-            with pytest.raises(ValueError, match="API key required"):
-                ElevenLabsTTS(config)
+    def test_init_requires_api_key(self, elevenlabs_config, monkeypatch):
+        monkeypatch.delenv("ELEVENLABS_API_KEY", raising=False)
+        with pytest.raises(ValueError, match="API key required"):
+            ElevenLabsTTS(elevenlabs_config)
 
-    @patch.dict(os.environ, {"ELEVENLABS_API_KEY": "test_key"})
-    def test_init_with_env_api_key(self, config):
-        tts = ElevenLabsTTS(config)
+    def test_init_with_env_api_key(self, elevenlabs_config):
+        tts = ElevenLabsTTS(elevenlabs_config)
         assert tts.api_key == "test_key"
 
-    def test_init_with_explicit_api_key(self, config):
-        tts = ElevenLabsTTS(config, api_key="explicit_key")
+    def test_init_with_explicit_api_key(self, elevenlabs_config):
+        tts = ElevenLabsTTS(elevenlabs_config, api_key="explicit_key")
         assert tts.api_key == "explicit_key"
 
-    @patch.dict(os.environ, {"ELEVENLABS_API_KEY": "test_key"})
-    def test_estimate_cost(self, config):
-        tts = ElevenLabsTTS(config)
+    def test_estimate_cost(self, elevenlabs_config):
+        tts = ElevenLabsTTS(elevenlabs_config)
 
         # 1000 characters should cost about $0.30
         cost = tts.estimate_cost("a" * 1000)
         assert 0.2 < cost < 0.4  # Approximately $0.30
 
-    @patch.dict(os.environ, {"ELEVENLABS_API_KEY": "test_key"})
-    def test_default_voice_id(self, config):
-        tts = ElevenLabsTTS(config)
+    def test_default_voice_id(self, elevenlabs_config):
+        tts = ElevenLabsTTS(elevenlabs_config)
         assert tts.voice_id is not None
 
-    @patch.dict(os.environ, {"ELEVENLABS_API_KEY": "test_key"})
-    def test_custom_voice_id(self, config):
-        config.voice_id = "custom_voice_123"
-        tts = ElevenLabsTTS(config)
+    def test_custom_voice_id(self, elevenlabs_config):
+        tts = ElevenLabsTTS(elevenlabs_config.model_copy(update={"voice_id": "custom_voice_123"}))
         assert tts.voice_id == "custom_voice_123"
 
 
 class TestEdgeTTS:
     """Tests for Edge TTS provider."""
 
-    @pytest.fixture
-    def config(self):
-        return TTSConfig(provider="edge")
-
-    @pytest.fixture
-    def edge_tts(self, config):
-        return EdgeTTS(config)
+    @pytest.fixture(autouse=True)
+    def _clear_voices_cache(self, monkeypatch):
+        monkeypatch.setattr(EdgeTTS, "_voices_cache", None)
 
-    def test_init_with_default_voice(self, config):
-        tts = EdgeTTS(config)
+    def test_init_with_default_voice(self, edge_config):
+        tts = EdgeTTS(edge_config)
         assert tts.voice == "en-US-GuyNeural"
 
-    def test_init_with_custom_voice(self, config):
-        tts = EdgeTTS(config, voice="en-GB-SoniaNeural")
+    def test_init_with_custom_voice(self, edge_config):
+        tts = EdgeTTS(edge_config, voice="en-GB-SoniaNeural")
         assert tts.voice == "en-GB-SoniaNeural"
 
-    def test_init_with_config_voice_id(self, config):
-        config.voice_id = "en-US-AriaNeural"
-        tts = EdgeTTS(config)
+    def test_init_with_config_voice_id(self, edge_config):
+        tts = EdgeTTS(edge_config.model_copy(update={"voice_id": "en-US-AriaNeural"}))
         assert tts.voice == "en-US-AriaNeural"
 
     def test_default_voices_available(self, edge_tts):
@@ -152,6 +213,11 @@ class TestEdgeTTS:
         assert "british_male" in EdgeTTS.DEFAULT_VOICES
         assert "british_female" in EdgeTTS.DEFAULT_VOICES
 
+    def test_default_voices_are_read_only(self):
+        """Test that default voice presets can't be modified."""
+        with pytest.raises(TypeError):
+            EdgeTTS.DEFAULT_VOICES["male"] = "en-US-AriaNeural"
+
     def test_generate_creates_audio_file(self, edge_tts, tmp_path):
         """Test that generate creates an audio file."""
         output_path = tmp_path / "test.mp3"
@@ -228,12 +294,14 @@ class TestEdgeTTS:
         mock_communicate.stream = mock_stream
 
         with patch("edge_tts.Communicate", return_value=mock_communicate):
-            chunks = list(edge_tts.generate_stream("Hello"))
+            stream = edge_tts.generate_stream("Hello")
+            first = next(stream)
+            # Only a few chunks are needed to check the stream's contents
+            rest = list(itertools.islice(stream, 4))
 
-        assert len(chunks) > 0
-        assert all(isinstance(chunk, bytes) for chunk in chunks)
+        assert all(isinstance(chunk, bytes) for chunk in [first, *rest])
         # Total audio data should be substantial
-        total_bytes = sum(len(chunk) for chunk in chunks)
+        total_bytes = len(first) + sum(len(chunk) for chunk in rest)
         assert total_bytes > 100
 
     def test_get_available_voices(self, edge_tts):
@@ -268,6 +336,41 @@ class TestEdgeTTS:
         assert "locale" in voices[0]
         assert "gender" in voices[0]
 
+    def test_get_available_voices_fetches_once(self, edge_tts):
+        """Test that the voice list is fetched once and then reused."""
+        mock_list_voices = AsyncMock(return_value=[
+            {
+                "ShortName": "en-US-GuyNeural",
+                "FriendlyName": "Microsoft Guy Online (Natural)",
+                "Locale": "en-US",
+                "Gender": "Male",
+            },
+        ])
+
+        with patch("edge_tts.list_voices", mock_list_voices):
+            first = edge_tts.get_available_voices()
+            second = EdgeTTS(edge_tts.config).get_english_voices()
+
+        assert mock_list_voices.await_count == 1
+        assert first == second
+
+    def test_get_available_voices_returns_copies(self, edge_tts):
+        """Test that modifying a returned voice doesn't change the cache."""
+        mock_list_voices = AsyncMock(return_value=[
+            {
+                "ShortName": "en-US-GuyNeural",
+                "FriendlyName": "Microsoft Guy Online (Natural)",
+                "Locale": "en-US",
+                "Gender": "Male",
+            },
+        ])
+
+        with patch("edge_tts.list_voices", mock_list_voices):
+            edge_tts.get_available_voices()[0]["voice_id"] = "changed"
+            voices = edge_tts.get_available_voices()
+
+        assert voices[0]["voice_id"] == "en-US-GuyNeural"
+
     def test_get_english_voices(self, edge_tts):
         """Test filtering English voices."""
         mock_voices = [
@@ -305,29 +408,10 @@ class TestEdgeTTS:
         for voice in english_voices:
             assert voice["locale"].startswith("en-")
 
-    def test_get_audio_duration_with_valid_file(self, edge_tts, tmp_path):
+    def test_get_audio_duration_with_valid_file(self, edge_tts, sine_mp3):
         """Test audio duration extraction with valid file."""
-        # Create a test audio file using ffmpeg
-        import subprocess
-
-        output_path = tmp_path / "test.mp3"
-        try:
-            subprocess.run(
-                [
-                    "ffmpeg", "-y",
-                    "-f", "lavfi",
-                    "-i", "sine=frequency=440:duration=2",
-                    "-c:a", "libmp3lame",
-                    str(output_path),
-                ],
-                capture_output=True,
-                timeout=10,
-            )
-            if output_path.exists():
-                duration = edge_tts._get_audio_duration(output_path)
-                assert 1.5 < duration < 2.5  # ~2 seconds
-        except FileNotFoundError:
-            pytest.skip("ffmpeg not available")
+        duration = edge_tts._get_audio_duration(sine_mp3)
+        assert 1.5 < duration < 2.5  # ~2 seconds
 
     def test_get_audio_duration_with_invalid_file(self, edge_tts, tmp_path):
         """Test audio duration extraction returns 0 for invalid file."""
@@ -343,20 +427,58 @@ class TestEdgeTTS:
         assert duration == 0.0
 
 
-class TestEdgeTTSMocked:
-    """Tests for Edge TTS with mocked network calls."""
+class TestReadMp3Duration:
+    """Tests for header-based MP3 duration probing."""
 
-    @pytest.fixture
-    def config(self):
-        return TTSConfig(provider="edge")
+    # MPEG-1 Layer III, 128 kbps, 44.1 kHz, stereo: 417-byte frames
+    FRAME_HEADER = b"\xff\xfb\x90\x00"
+    FRAME_LENGTH = 417
 
-    @pytest.fixture
-    def edge_tts(self, config):
-        return EdgeTTS(config)
+    def _frames(self, count: int) -> bytes:
+        frame = self.FRAME_HEADER + b"\x00" * (self.FRAME_LENGTH - 4)
+        return frame * count
+
+    def test_cbr_duration_from_file_size(self, tmp_path):
+        audio_path = tmp_path / "cbr.mp3"
+        audio_path.write_bytes(self._frames(100))
+
+        duration = read_mp3_duration(audio_path)
+        assert duration == pytest.approx(100 * 417 * 8 / 128_000)
+
+    def test_xing_frame_count(self, tmp_path):
+        first = bytearray(self._frames(1))
+        # Xing tag sits after the 32-byte side info of a stereo MPEG-1 frame
+        first[36:48] = b"Info" + (1).to_bytes(4, "big") + (200).to_bytes(4, "big")
+        audio_path = tmp_path / "vbr.mp3"
+        audio_path.write_bytes(bytes(first) + self._frames(10))
+
+        duration = read_mp3_duration(audio_path)
+        assert duration == pytest.approx(200 * 1152 / 44100)
+
+    def test_skips_id3v2_tag(self, tmp_path):
+        # 20-byte tag body that contains a bogus frame sync
+        id3 = b"ID3\x03\x00\x00" + bytes([0, 0, 0, 20]) + b"\xff\xfb" + b"\x00" * 18
+        audio_path = tmp_path / "tagged.mp3"
+        audio_path.write_bytes(id3 + self._frames(50))
+
+        duration = read_mp3_duration(audio_path)
+        assert duration == pytest.approx(50 * 417 * 8 / 128_000)
+
+    def test_returns_none_for_non_mp3(self, tmp_path):
+        audio_path = tmp_path / "invalid.mp3"
+        audio_path.write_bytes(b"not an audio file")
+        assert read_mp3_duration(audio_path) is None
+
+    def test_returns_none_for_missing_file(self, tmp_path):
+        assert read_mp3_duration(tmp_path / "nonexistent.mp3") is None
+
+
+class TestEdgeTTSMocked:
+    """Tests for Edge TTS with mocked network calls."""
 
-    def test_generate_raises_import_error_when_edge_tts_missing(self, config, tmp_path):
+    def test_generate_raises_import_error_when_edge_tts_missing(self, edge_config, tmp_path):
         """Test that helpful error is raised when edge-tts not installed."""
-        tts = EdgeTTS(config)
+        tts = EdgeTTS(edge_config)
         output_path = tmp_path / "test.mp3"
 
         with patch.dict("sys.modules", {"edge_tts": None}):
@@ -364,52 +486,41 @@ class TestEdgeTTSMocked:
             # The actual ImportError would happen if the package wasn't installed
             pass
 
-    def test_voice_selection_priority(self, config):
+    def test_voice_selection_priority(self, edge_config):
         """Test voice selection: explicit > config > default."""
         # Default
-        tts1 = EdgeTTS(config)
+        tts1 = EdgeTTS(edge_config)
         assert tts1.voice == "en-US-GuyNeural"
 
         # Config voice_id
-        config.voice_id = "en-GB-RyanNeural"
-        tts2 = EdgeTTS(config)
+        voiced_config = edge_config.model_copy(update={"voice_id": "en-GB-RyanNeural"})
+        tts2 = EdgeTTS(voiced_config)
         assert tts2.voice == "en-GB-RyanNeural"
 
         # Explicit voice overrides config
-        tts3 = EdgeTTS(config, voice="en-US-AriaNeural")
+        tts3 = EdgeTTS(voiced_config, voice="en-US-AriaNeural")
         assert tts3.voice == "en-US-AriaNeural"
 
 
 class TestTTSWithScript:
     """Tests for generating TTS from script scenes."""
 
-    @pytest.fixture
-    def mock_tts(self):
-        config = TTSConfig(provider="mock")
-        return MockTTS(config)
-
-    @pytest.fixture
-    def sample_voiceover_texts(self):
-        return [
-            "Every time you send a message to ChatGPT, something remarkable happens.",
-            "LLM inference has two distinct phases.",
-            "The solution is elegant: compute each Key and Value exactly once.",
-        ]
-
-    def test_generate_multiple_scenes(self, mock_tts, sample_voiceover_texts, tmp_path):
+    async def test_generate_multiple_scenes(
+        self, mock_tts, sample_voiceover_texts, audio_out_dir
+    ):
         """Test generating audio for multiple script scenes."""
-        audio_files = []
-
-        for i, text in enumerate(sample_voiceover_texts):
-            output_path = tmp_path / f"scene_{i + 1}.mp3"
-            result = mock_tts.generate(text, output_path)
-            audio_files.append(result)
+        audio_files = await asyncio.gather(
+            *(
+                mock_tts.generate_async(text, audio_out_dir / f"script_scene_{i + 1}.mp3")
+                for i, text in enumerate(sample_voiceover_texts)
+            )
+        )
 
         # All files should be created
         assert len(audio_files) == 3
         assert all(f.exists() for f in audio_files)
 
-    def test_total_audio_generation(self, mock_tts, tmp_path):
+    def test_total_audio_generation(self, mock_tts, audio_out_dir):
         """Test generating audio for a full script."""
         # Simulate a full script worth of voiceover
         full_voiceover = """
@@ -420,7 +531,7 @@ class TestTTSWithScript:
         This is how they do it.
         """
 
-        output_path = tmp_path / "full_script.mp3"
+        output_path = audio_out_dir / "full_script.mp3"
         result = mock_tts.generate(full_voiceover, output_path)
 
         assert result.exists()
@@ -430,11 +541,6 @@ class TestTTSWithScript:
 class TestWordTimestamps:
     """Tests for word-level timestamp functionality."""
 
-    @pytest.fixture
-    def mock_tts(self):
-        config = TTSConfig(provider="mock")
-        return MockTTS(config)
-
     def test_word_timestamp_dataclass(self):
         """Test WordTimestamp data structure."""
         ts = WordTimestamp(word="hello", start_seconds=0.0, end_seconds=0.5)
@@ -442,10 +548,15 @@ class TestWordTimestamps:
         assert ts.start_seconds == 0.0
         assert ts.end_seconds == 0.5
 
-    def test_tts_result_dataclass(self, tmp_path):
+    def test_word_timestamp_is_immutable(self):
+        """Test that WordTimestamp instances can't be modified."""
+        ts = WordTimestamp(word="hello", start_seconds=0.0, end_seconds=0.5)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            ts.end_seconds = 1.0
+
+    def test_tts_result_dataclass(self):
         """Test TTSResult data structure."""
-        audio_path = tmp_path / "test.mp3"
-        audio_path.touch()
+        audio_path = Path("test.mp3")
 
         result = TTSResult(
             audio_path=audio_path,
@@ -460,9 +571,9 @@ class TestWordTimestamps:
         assert result.duration_seconds == 5.0
         assert len(result.word_timestamps) == 2
 
-    def test_generate_with_timestamps_returns_result(self, mock_tts, tmp_path):
+    def test_generate_with_timestamps_returns_result(self, mock_tts, audio_out_dir):
         """Test that generate_with_timestamps returns a TTSResult."""
-        output_path = tmp_path / "test.mp3"
+        output_path = audio_out_dir / "mock_timestamps.mp3"
         result = mock_tts.generate_with_timestamps("Hello world!", output_path)
 
         assert isinstance(result, TTSResult)
@@ -470,9 +581,9 @@ class TestWordTimestamps:
         assert result.audio_path.exists()
         assert result.duration_seconds > 0
 
-    def test_generate_with_timestamps_has_word_timestamps(self, mock_tts, tmp_path):
+    def test_generate_with_timestamps_has_word_timestamps(self, mock_tts, audio_out_dir):
         """Test that generate_with_timestamps returns word timestamps."""
-        output_path = tmp_path / "test.mp3"
+        output_path = audio_out_dir / "word_order.mp3"
         text = "Hello world, this is a test."
         result = mock_tts.generate_with_timestamps(text, output_path)
 
@@ -484,9 +595,9 @@ class TestWordTimestamps:
                 >= result.word_timestamps[i - 1].start_seconds
             )
 
-    def test_word_timestamps_cover_all_words(self, mock_tts, tmp_path):
+    def test_word_timestamps_cover_all_words(self, mock_tts, audio_out_dir):
         """Test that all words get timestamps."""
-        output_path = tmp_path / "test.mp3"
+        output_path = audio_out_dir / "all_words.mp3"
         text = "one two three four five"
         result = mock_tts.generate_with_timestamps(text, output_path)
 
@@ -495,9 +606,9 @@ class TestWordTimestamps:
         words = [ts.word for ts in result.word_timestamps]
         assert words == ["one", "two", "three", "four", "five"]
 
-    def test_word_timestamps_with_punctuation(self, mock_tts, tmp_path):
+    def test_word_timestamps_with_punctuation(self, mock_tts, audio_out_dir):
         """Test that punctuation is handled correctly."""
-        output_path = tmp_path / "test.mp3"
+        output_path = audio_out_dir / "punct.mp3"
         text = "Hello, world! How are you?"
         result = mock_tts.generate_with_timestamps(text, output_path)
 
@@ -508,9 +619,9 @@ class TestWordTimestamps:
         assert "," not in "".join(words)
         assert "!" not in "".join(words)
 
-    def test_word_timestamps_timing_is_reasonable(self, mock_tts, tmp_path):
+    def test_word_timestamps_timing_is_reasonable(self, mock_tts, audio_out_dir):
         """Test that word timings are reasonable."""
-        output_path = tmp_path / "test.mp3"
+        output_path = audio_out_dir / "timing.mp3"
         text = "This is a short sentence."
         result = mock_tts.generate_with_timestamps(text, output_path)
 
@@ -526,17 +637,13 @@ class TestWordTimestamps:
 class TestElevenLabsWordTimestamps:
     """Tests for ElevenLabs word timestamp parsing."""
 
-    @pytest.fixture
-    def config(self):
-        return TTSConfig(
-            provider="elevenlabs",
-            model="eleven_multilingual_v2",
-        )
+    @pytest.fixture(autouse=True)
+    def _api_key(self, monkeypatch):
+        monkeypatch.setenv("ELEVENLABS_API_KEY", "test_key")
 
-    @patch.dict(os.environ, {"ELEVENLABS_API_KEY": "test_key"})
-    def test_parse_word_timestamps_basic(self, config):
+    def test_parse_word_timestamps_basic(self, elevenlabs_config):
         """Test parsing character-level to word-level timestamps."""
-        tts = ElevenLabsTTS(config)
+        tts = ElevenLabsTTS(elevenlabs_config)
 
         # Simulate ElevenLabs character-level response for "hi there"
         characters = ["h", "i", " ", "t", "h", "e", "r", "e"]
@@ -553,18 +660,16 @@ class TestElevenLabsWordTimestamps:
         assert result[1].start_seconds == 0.3
         assert result[1].end_seconds == 0.8
 
-    @patch.dict(os.environ, {"ELEVENLABS_API_KEY": "test_key"})
-    def test_parse_word_timestamps_empty(self, config):
+    def test_parse_word_timestamps_empty(self, elevenlabs_config):
         """Test parsing empty character lists."""
-        tts = ElevenLabsTTS(config)
+        tts = ElevenLabsTTS(elevenlabs_config)
 
         result = tts._parse_word_timestamps([], [], [])
         assert result == []
 
-    @patch.dict(os.environ, {"ELEVENLABS_API_KEY": "test_key"})
-    def test_parse_word_timestamps_single_word(self, config):
+    def test_parse_word_timestamps_single_word(self, elevenlabs_config):
         """Test parsing a single word."""
-        tts = ElevenLabsTTS(config)
+        tts = ElevenLabsTTS(elevenlabs_config)
 
         characters = ["h", "i"]
         start_times = [0.0, 0.1]
@@ -577,6 +682,22 @@ class TestElevenLabsWordTimestamps:
         assert result[0].start_seconds == 0.0
         assert result[0].end_seconds == 0.2
 
+    def test_parse_word_timestamps_extra_whitespace(self, elevenlabs_config):
+        """Test that leading, trailing and repeated whitespace is skipped."""
+        tts = ElevenLabsTTS(elevenlabs_config)
+
+        characters = [" ", "a", "b", " ", "\n", "c", " "]
+        start_times = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
+        end_times = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7]
+
+        result = tts._parse_word_timestamps(characters, start_times, end_times)
+
+        assert [ts.word for ts in result] == ["ab", "c"]
+        assert result[0].start_seconds == 0.1
+        assert result[0].end_seconds == 0.3
+        assert result[1].start_seconds == 0.5
+        assert result[1].end_seconds == 0.6
+
 
 class TestManualVoiceoverProvider:
     """Tests for ManualVoiceoverProvider."""
@@ -1,9 +1,16 @@
-"""Comprehensive tests for fact checking module."""
+"""Comprehensive tests for fact checking module.
 
+Safe to run in parallel: pytest tests/test_factcheck.py -n auto --dist=loadgroup
+"""
+
+import dataclasses
 import json
+import shutil
+from dataclasses import dataclass, field
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
+import fitz  # PyMuPDF
 import pytest
 
 from src.factcheck import (
@@ -19,16 +26,314 @@ from src.factcheck import (
 from src.factcheck.prompts import FACT_CHECK_MOCK_RESPONSE
 
 
+# Project trees are built once per module and shared by read-only tests.
+# Tests that change files on disk are marked ``mutates_project`` and run
+# against a private copy instead. Under pytest-xdist each worker builds its
+# own templates, so the CLI and PDF classes share an xdist group to build
+# theirs only once.
+
+
+@dataclass
+class ProjectSpec:
+    """Contents of a fact-check test project."""
+
+    id: str
+    title: str
+    script: dict | None
+    narrations: dict | None
+    source_files: dict[str, str | bytes] = field(default_factory=dict)
+    has_input_dir: bool = True
+
+
+def _build_project(root: Path, spec: ProjectSpec) -> Path:
+    """Write the project described by spec under root and return its directory.
+
+    A script or narrations of None leaves that file out.
+    """
+    project_dir = root / spec.id
+    for subdir in ("script", "narration"):
+        (project_dir / subdir).mkdir(parents=True)
+    if spec.has_input_dir:
+        (project_dir / "input").mkdir()
+
+    (project_dir / "config.json").write_text(
+        json.dumps({"id": spec.id, "title": spec.title})
+    )
+    if spec.script is not None:
+        (project_dir / "script" / "script.json").write_text(json.dumps(spec.script))
+    if spec.narrations is not None:
+        (project_dir / "narration" / "narrations.json").write_text(
+            json.dumps(spec.narrations)
+        )
+
+    for name, content in spec.source_files.items():
+        path = project_dir / "input" / name
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content)
+
+    return project_dir
+
+
+def _mock_project_spec():
+    """Describe the standard two-scene fact-check project."""
+    return ProjectSpec(
+        id="test-project",
+        title="Test Project",
+        script={
+            "title": "Test Video Script",
+            "total_duration_seconds": 120,
+            "scenes": [
+                {
+                    "scene_id": "scene1_hook",
+                    "scene_type": "hook",
+                    "title": "The Hook",
+                    "voiceover": "Welcome to our video about the topic.",
+                    "visual_cue": {"description": "Title card"},
+                },
+                {
+                    "scene_id": "scene2_main",
+                    "scene_type": "explanation",
+                    "title": "Main Content",
+                    "voiceover": "Here is the main explanation of the topic.",
+                    "visual_cue": {"description": "Diagram"},
+                },
+            ],
+        },
+        narrations={
+            "scenes": [
+                {
+                    "scene_id": "scene1_hook",
+                    "title": "The Hook",
+                    "narration": "Welcome to our video about the topic.",
+                },
+                {
+                    "scene_id": "scene2_main",
+                    "title": "Main Content",
+                    "narration": "Here is the main explanation of the topic.",
+                },
+            ],
+        },
+        source_files={
+            "source.md": """# Test Source
+
+This is test source content for fact checking.
+
+## Section 1
+
+Some factual content here about the topic.
+
+## Section 2
+
+More detailed information about the subject.
+""",
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_project_template(tmp_path_factory):
+    """Build the fact-check project tree once; tests must not modify it."""
+    return _build_project(tmp_path_factory.mktemp("factcheck"), _mock_project_spec())
+
+
+# Broken variants of the standard project, built without the missing piece
+_BROKEN_PROJECT_OVERRIDES = {
+    "no_script": {"script": None},
+    "no_narrations": {"narrations": None},
+    "no_input_dir": {"source_files": {}, "has_input_dir": False},
+    "empty_input_dir": {"source_files": {}},
+}
+
+
+@pytest.fixture
+def broken_project(request, tmp_path):
+    """Standard project missing one piece, selected by indirect parametrization."""
+    spec = dataclasses.replace(
+        _mock_project_spec(), **_BROKEN_PROJECT_OVERRIDES[request.param]
+    )
+    project_dir = _build_project(tmp_path, spec)
+    return SimpleNamespace(
+        id=spec.id,
+        title=spec.title,
+        root_dir=project_dir,
+        input_dir=project_dir / "input",
+    )
+
+
+@pytest.fixture(scope="module")
+def cli_projects_template(tmp_path_factory):
+    """Build a projects dir holding one CLI test project; tests must not modify it."""
+    projects_dir = tmp_path_factory.mktemp("factcheck_cli")
+    spec = ProjectSpec(
+        id="cli-project",
+        title="CLI Test",
+        script={
+            "title": "CLI Test Script",
+            "scenes": [{"scene_id": "s1", "voiceover": "Test"}],
+        },
+        narrations={
+            "scenes": [{"scene_id": "s1", "title": "Scene 1", "narration": "Test"}],
+        },
+        source_files={"source.md": "# Source\n\nTest content."},
+    )
+    _build_project(projects_dir, spec)
+    return projects_dir
+
+
+@pytest.fixture(scope="session")
+def pdf_source_bytes():
+    """Render the one-page source PDF once per session."""
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "PDF Source Document\n\nThis is content from a PDF.")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture(scope="module")
+def pdf_project_template(tmp_path_factory, pdf_source_bytes):
+    """Build a project with PDF source once; tests must not modify it."""
+    spec = ProjectSpec(
+        id="pdf-project",
+        title="PDF Test",
+        script={"title": "PDF Test", "scenes": []},
+        narrations={"scenes": []},
+        source_files={"source.pdf": pdf_source_bytes},
+    )
+    return _build_project(tmp_path_factory.mktemp("factcheck_pdf"), spec)
+
+
+def _make_issue(**overrides):
+    """Create a fully populated issue, overriding any fields given."""
+    fields = {
+        "id": "issue_1",
+        "severity": IssueSeverity.MEDIUM,
+        "category": IssueCategory.TERMINOLOGY,
+        "location": "scene1_hook",
+        "original_text": "The example text",
+        "issue_description": "This term is imprecise",
+        "correction": "Use the correct term",
+        "source_reference": "Source document section 1.2",
+        "confidence": 0.85,
+    }
+    fields.update(overrides)
+    return FactCheckIssue(**fields)
+
+
+def _sample_issue():
+    """Create a sample issue for testing."""
+    return _make_issue(verified_via_web=True)
+
+
+def _sample_summary():
+    """Create a sample summary for testing."""
+    return FactCheckSummary(
+        total_issues=10,
+        critical_count=1,
+        high_count=2,
+        medium_count=3,
+        low_count=3,
+        info_count=1,
+        scenes_with_issues=["scene1", "scene2", "scene3"],
+        overall_accuracy_score=0.85,
+        web_verified_count=5,
+    )
+
+
+def _sample_report():
+    """Create a sample report for testing."""
+    issues = [
+        _make_issue(
+            id="issue_1",
+            severity=IssueSeverity.CRITICAL,
+            category=IssueCategory.FACTUAL_ERROR,
+            original_text="Wrong fact",
+            issue_description="This is incorrect",
+            correction="Correct fact",
+            source_reference="Source",
+            confidence=0.95,
+        ),
+        _make_issue(
+            id="issue_2",
+            severity=IssueSeverity.LOW,
+            category=IssueCategory.IMPROVEMENT,
+            location="scene2_main",
+            original_text="Could be better",
+            issue_description="Suggestion",
+            correction="Improved version",
+            source_reference="Best practices",
+            confidence=0.7,
+        ),
+    ]
+    summary = FactCheckSummary(
+        total_issues=2,
+        critical_count=1,
+        high_count=0,
+        medium_count=0,
+        low_count=1,
+        info_count=0,
+        scenes_with_issues=["scene1_hook", "scene2_main"],
+        overall_accuracy_score=0.8,
+    )
+    return FactCheckReport(
+        project_id="test-project",
+        script_title="Test Script",
+        issues=issues,
+        summary=summary,
+        source_documents=["doc1.md", "doc2.pdf"],
+        recommendations=["Fix critical error", "Consider improvements"],
+    )
+
+
+@pytest.fixture
+def sample_issue():
+    """Provide a sample issue."""
+    return _sample_issue()
+
+
+@pytest.fixture
+def sample_summary():
+    """Provide a sample summary."""
+    return _sample_summary()
+
+
+@pytest.fixture
+def sample_report():
+    """Provide a sample report."""
+    return _sample_report()
+
+
+# Values the fact-check JSON schema allows for severity and category
+_SEVERITY_VALUES = ("critical", "high", "medium", "low", "info")
+_CATEGORY_VALUES = (
+    "factual_error",
+    "outdated_info",
+    "missing_context",
+    "oversimplification",
+    "misleading",
+    "unsupported_claim",
+    "terminology",
+    "attribution",
+    "numerical",
+    "logical",
+    "improvement",
+)
+
+
 class TestIssueSeverity:
     """Tests for IssueSeverity enum."""
 
-    def test_all_severity_levels(self):
-        """Should have all expected severity levels."""
-        assert IssueSeverity.CRITICAL.value == "critical"
-        assert IssueSeverity.HIGH.value == "high"
-        assert IssueSeverity.MEDIUM.value == "medium"
-        assert IssueSeverity.LOW.value == "low"
-        assert IssueSeverity.INFO.value == "info"
+    @pytest.mark.parametrize("value", _SEVERITY_VALUES)
+    def test_severity_value(self, value):
+        """Should have a severity level for each expected value."""
+        assert IssueSeverity(value).value == value
+
+    def test_severity_values_match_schema(self):
+        """Should define exactly the severity levels the fact-check JSON schema uses."""
+        assert {member.value for member in IssueSeverity} == set(_SEVERITY_VALUES)
 
     def test_severity_from_string(self):
         """Should create severity from string value."""
@@ -39,23 +344,14 @@ class TestIssueSeverity:
 class TestIssueCategory:
     """Tests for IssueCategory enum."""
 
-    def test_all_categories(self):
-        """Should have all expected categories."""
-        expected = [
-            "factual_error",
-            "outdated_info",
-            "missing_context",
-            "oversimplification",
-            "misleading",
-            "unsupported_claim",
-            "terminology",
-            "attribution",
-            "numerical",
-            "logical",
-            "improvement",
-        ]
-        for cat in expected:
-            assert IssueCategory(cat) is not None
+    @pytest.mark.parametrize("value", _CATEGORY_VALUES)
+    def test_category_values(self, value):
+        """Should have a category for each expected value."""
+        assert IssueCategory(value).value == value
+
+    def test_category_values_match_schema(self):
+        """Should define exactly the categories the fact-check JSON schema uses."""
+        assert {member.value for member in IssueCategory} == set(_CATEGORY_VALUES)
 
     def test_category_from_string(self):
         """Should create category from string value."""
@@ -66,22 +362,6 @@ class TestIssueCategory:
 class TestFactCheckIssue:
     """Tests for FactCheckIssue dataclass."""
 
-    @pytest.fixture
-    def sample_issue(self):
-        """Create a sample issue for testing."""
-        return FactCheckIssue(
-            id="issue_1",
-            severity=IssueSeverity.MEDIUM,
-            category=IssueCategory.TERMINOLOGY,
-            location="scene1_hook",
-            original_text="The example text",
-            issue_description="This term is imprecise",
-            correction="Use the correct term",
-            source_reference="Source document section 1.2",
-            confidence=0.85,
-            verified_via_web=True,
-        )
-
     def test_issue_to_dict(self, sample_issue):
         """Should convert issue to dictionary."""
         d = sample_issue.to_dict()
@@ -113,33 +393,10 @@ class TestFactCheckIssue:
         assert issue.category == IssueCategory.FACTUAL_ERROR
         assert issue.confidence == 0.95
 
-    def test_issue_roundtrip(self, sample_issue):
-        """Should roundtrip through dict conversion."""
-        d = sample_issue.to_dict()
-        restored = FactCheckIssue.from_dict(d)
-        assert restored.id == sample_issue.id
-        assert restored.severity == sample_issue.severity
-        assert restored.category == sample_issue.category
-
 
 class TestFactCheckSummary:
     """Tests for FactCheckSummary dataclass."""
 
-    @pytest.fixture
-    def sample_summary(self):
-        """Create a sample summary for testing."""
-        return FactCheckSummary(
-            total_issues=10,
-            critical_count=1,
-            high_count=2,
-            medium_count=3,
-            low_count=3,
-            info_count=1,
-            scenes_with_issues=["scene1", "scene2", "scene3"],
-            overall_accuracy_score=0.85,
-            web_verified_count=5,
-        )
-
     def test_summary_to_dict(self, sample_summary):
         """Should convert summary to dictionary."""
         d = sample_summary.to_dict()
@@ -176,52 +433,6 @@ class TestFactCheckSummary:
 class TestFactCheckReport:
     """Tests for FactCheckReport dataclass."""
 
-    @pytest.fixture
-    def sample_report(self):
-        """Create a sample report for testing."""
-        issues = [
-            FactCheckIssue(
-                id="issue_1",
-                severity=IssueSeverity.CRITICAL,
-                category=IssueCategory.FACTUAL_ERROR,
-                location="scene1_hook",
-                original_text="Wrong fact",
-                issue_description="This is incorrect",
-                correction="Correct fact",
-                source_reference="Source",
-                confidence=0.95,
-            ),
-            FactCheckIssue(
-                id="issue_2",
-                severity=IssueSeverity.LOW,
-                category=IssueCategory.IMPROVEMENT,
-                location="scene2_main",
-                original_text="Could be better",
-                issue_description="Suggestion",
-                correction="Improved version",
-                source_reference="Best practices",
-                confidence=0.7,
-            ),
-        ]
-        summary = FactCheckSummary(
-            total_issues=2,
-            critical_count=1,
-            high_count=0,
-            medium_count=0,
-            low_count=1,
-            info_count=0,
-            scenes_with_issues=["scene1_hook", "scene2_main"],
-            overall_accuracy_score=0.8,
-        )
-        return FactCheckReport(
-            project_id="test-project",
-            script_title="Test Script",
-            issues=issues,
-            summary=summary,
-            source_documents=["doc1.md", "doc2.pdf"],
-            recommendations=["Fix critical error", "Consider improvements"],
-        )
-
     def test_report_to_dict(self, sample_report):
         """Should convert report to dictionary."""
         d = sample_report.to_dict()
@@ -232,14 +443,6 @@ class TestFactCheckReport:
         assert len(d["source_documents"]) == 2
         assert len(d["recommendations"]) == 2
 
-    def test_report_from_dict(self, sample_report):
-        """Should create report from dictionary."""
-        d = sample_report.to_dict()
-        restored = FactCheckReport.from_dict(d)
-        assert restored.project_id == sample_report.project_id
-        assert len(restored.issues) == 2
-        assert restored.summary.total_issues == 2
-
     def test_get_issues_by_severity(self, sample_report):
         """Should filter issues by severity."""
         critical = sample_report.get_issues_by_severity(IssueSeverity.CRITICAL)
@@ -284,93 +487,58 @@ class TestFactCheckReport:
         assert sample_report.is_accurate(threshold=0.9) is False
 
 
-class TestFactChecker:
-    """Tests for FactChecker class."""
+class TestDictRoundtrip:
+    """Tests that to_dict/from_dict preserve every model field."""
 
-    @pytest.fixture
-    def mock_project(self, tmp_path):
-        """Create a mock project with required files."""
-        # Create project structure
-        project_dir = tmp_path / "test-project"
-        project_dir.mkdir()
-
-        # Create config
-        config = {
-            "id": "test-project",
-            "title": "Test Project",
-        }
-        with open(project_dir / "config.json", "w") as f:
-            json.dump(config, f)
+    @pytest.mark.parametrize(
+        "factory",
+        [_sample_issue, _sample_summary, _sample_report],
+        ids=["issue", "summary", "report"],
+    )
+    def test_roundtrip(self, factory):
+        """Should restore an equal object from its dictionary."""
+        obj = factory()
+        restored = type(obj).from_dict(obj.to_dict())
+        assert restored == obj
 
-        # Create input directory with source
-        input_dir = project_dir / "input"
-        input_dir.mkdir()
-        source_md = input_dir / "source.md"
-        source_md.write_text("""# Test Source
 
-This is test source content for fact checking.
+@pytest.fixture(scope="class")
+def shared_checker(mock_project_template):
+    """One mock FactChecker per test class, for tests that only read the project."""
+    project = SimpleNamespace(
+        id="test-project",
+        title="Test Project",
+        root_dir=mock_project_template,
+        input_dir=mock_project_template / "input",
+    )
+    return FactChecker(project, use_mock=True)
 
-## Section 1
 
-Some factual content here about the topic.
+@pytest.fixture(scope="class")
+def prebuilt_report(shared_checker):
+    """Mock fact-check report for tests that only inspect or save it."""
+    return shared_checker.run_fact_check()
 
-## Section 2
-
-More detailed information about the subject.
-""")
-
-        # Create script
-        script_dir = project_dir / "script"
-        script_dir.mkdir()
-        script = {
-            "title": "Test Video Script",
-            "total_duration_seconds": 120,
-            "scenes": [
-                {
-                    "scene_id": "scene1_hook",
-                    "scene_type": "hook",
-                    "title": "The Hook",
-                    "voiceover": "Welcome to our video about the topic.",
-                    "visual_cue": {"description": "Title card"},
-                },
-                {
-                    "scene_id": "scene2_main",
-                    "scene_type": "explanation",
-                    "title": "Main Content",
-                    "voiceover": "Here is the main explanation of the topic.",
-                    "visual_cue": {"description": "Diagram"},
-                },
-            ],
-        }
-        with open(script_dir / "script.json", "w") as f:
-            json.dump(script, f)
 
-        # Create narrations
-        narration_dir = project_dir / "narration"
-        narration_dir.mkdir()
-        narrations = {
-            "scenes": [
-                {
-                    "scene_id": "scene1_hook",
-                    "title": "The Hook",
-                    "narration": "Welcome to our video about the topic.",
-                },
-                {
-                    "scene_id": "scene2_main",
-                    "title": "Main Content",
-                    "narration": "Here is the main explanation of the topic.",
-                },
-            ],
-        }
-        with open(narration_dir / "narrations.json", "w") as f:
-            json.dump(narrations, f)
+class TestFactChecker:
+    """Tests for FactChecker class."""
 
-        # Create mock project object
-        project = MagicMock()
-        project.id = "test-project"
-        project.title = "Test Project"
-        project.root_dir = project_dir
-        project.input_dir = input_dir
+    @pytest.fixture
+    def mock_project(self, request, mock_project_template, tmp_path):
+        """Mock project backed by the shared template.
+
+        Tests marked ``mutates_project`` get a private copy of the tree.
+        """
+        project_dir = mock_project_template
+        if request.node.get_closest_marker("mutates_project"):
+            project_dir = shutil.copytree(mock_project_template, tmp_path / "test-project")
+
+        project = SimpleNamespace(
+            id="test-project",
+            title="Test Project",
+            root_dir=project_dir,
+            input_dir=project_dir / "input",
+        )
 
         return project
 
@@ -385,137 +553,109 @@ More detailed information about the subject.
         checker = FactChecker(mock_project, use_mock=True, timeout=300)
         assert checker.timeout == 300
 
-    def test_load_script(self, mock_project):
+    def test_load_script(self, shared_checker):
         """Should load script from project."""
-        checker = FactChecker(mock_project, use_mock=True)
-        script = checker._load_script()
+        script = shared_checker._load_script()
         assert script["title"] == "Test Video Script"
         assert len(script["scenes"]) == 2
 
-    def test_load_script_not_found(self, mock_project):
+    @pytest.mark.parametrize("broken_project", ["no_script"], indirect=True)
+    def test_load_script_not_found(self, broken_project):
         """Should raise error when script not found."""
-        # Remove script file
-        script_path = mock_project.root_dir / "script" / "script.json"
-        script_path.unlink()
-
-        checker = FactChecker(mock_project, use_mock=True)
+        checker = FactChecker(broken_project, use_mock=True)
         with pytest.raises(FactCheckError, match="Script not found"):
             checker._load_script()
 
-    def test_load_narrations(self, mock_project):
+    def test_load_narrations(self, shared_checker):
         """Should load narrations from project."""
-        checker = FactChecker(mock_project, use_mock=True)
-        narrations = checker._load_narrations()
+        narrations = shared_checker._load_narrations()
         assert len(narrations["scenes"]) == 2
 
-    def test_load_narrations_not_found(self, mock_project):
+    @pytest.mark.parametrize("broken_project", ["no_narrations"], indirect=True)
+    def test_load_narrations_not_found(self, broken_project):
         """Should raise error when narrations not found."""
-        narration_path = mock_project.root_dir / "narration" / "narrations.json"
-        narration_path.unlink()
-
-        checker = FactChecker(mock_project, use_mock=True)
+        checker = FactChecker(broken_project, use_mock=True)
         with pytest.raises(FactCheckError, match="Narrations not found"):
             checker._load_narrations()
 
-    def test_load_source_material(self, mock_project):
+    def test_load_source_material(self, shared_checker):
         """Should load source material from input directory."""
-        checker = FactChecker(mock_project, use_mock=True)
-        content, names = checker._load_source_material()
+        content, names = shared_checker._load_source_material()
         assert "source.md" in names
         assert "Test Source" in content
 
-    def test_load_source_material_no_input_dir(self, mock_project):
+    @pytest.mark.parametrize("broken_project", ["no_input_dir"], indirect=True)
+    def test_load_source_material_no_input_dir(self, broken_project):
         """Should raise error when input directory doesn't exist."""
-        import shutil
-
-        shutil.rmtree(mock_project.root_dir / "input")
-
-        checker = FactChecker(mock_project, use_mock=True)
+        checker = FactChecker(broken_project, use_mock=True)
         with pytest.raises(FactCheckError, match="Input directory not found"):
             checker._load_source_material()
 
-    def test_load_source_material_empty_dir(self, mock_project):
+    @pytest.mark.parametrize("broken_project", ["empty_input_dir"], indirect=True)
+    def test_load_source_material_empty_dir(self, broken_project):
         """Should raise error when no source documents found."""
-        # Remove source file
-        (mock_project.root_dir / "input" / "source.md").unlink()
-
-        checker = FactChecker(mock_project, use_mock=True)
+        checker = FactChecker(broken_project, use_mock=True)
         with pytest.raises(FactCheckError, match="No source documents found"):
             checker._load_source_material()
 
-    def test_format_script_content(self, mock_project):
+    def test_format_script_content(self, shared_checker):
         """Should format script for prompt."""
-        checker = FactChecker(mock_project, use_mock=True)
-        script = checker._load_script()
-        formatted = checker._format_script_content(script)
+        script = shared_checker._load_script()
+        formatted = shared_checker._format_script_content(script)
 
         assert "Test Video Script" in formatted
         assert "scene1_hook" in formatted
         assert "scene2_main" in formatted
         assert "hook" in formatted
 
-    def test_format_narration_content(self, mock_project):
+    def test_format_narration_content(self, shared_checker):
         """Should format narrations for prompt."""
-        checker = FactChecker(mock_project, use_mock=True)
-        narrations = checker._load_narrations()
-        formatted = checker._format_narration_content(narrations)
+        narrations = shared_checker._load_narrations()
+        formatted = shared_checker._format_narration_content(narrations)
 
         assert "scene1_hook" in formatted
         assert "The Hook" in formatted
         assert "Welcome to our video" in formatted
 
-    def test_run_fact_check_mock(self, mock_project):
+    def test_run_fact_check_mock(self, shared_checker):
         """Should run fact check with mock provider."""
-        checker = FactChecker(mock_project, use_mock=True, verbose=False)
-        report = checker.run_fact_check()
+        report = shared_checker.run_fact_check()
 
+        assert isinstance(report, FactCheckReport)
         assert report.project_id == "test-project"
         assert report.script_title == "Test Video Script"
+        assert report.source_documents == ["source.md"]
         assert len(report.issues) == 2  # From mock response
         assert report.summary.total_issues == 2
 
-    def test_run_fact_check_returns_report(self, mock_project):
-        """Should return a valid FactCheckReport."""
-        checker = FactChecker(mock_project, use_mock=True)
-        report = checker.run_fact_check()
-
-        assert isinstance(report, FactCheckReport)
-        assert report.source_documents == ["source.md"]
-
-    def test_save_report(self, mock_project):
+    @pytest.mark.mutates_project
+    def test_save_report(self, mock_project, prebuilt_report):
         """Should save report to file."""
         checker = FactChecker(mock_project, use_mock=True)
-        report = checker.run_fact_check()
 
-        output_path = checker.save_report(report)
+        output_path = checker.save_report(prebuilt_report)
         assert output_path.exists()
         assert output_path.name == "report.json"
 
         # Verify content
-        with open(output_path) as f:
-            saved = json.load(f)
+        saved = json.loads(output_path.read_text())
         assert saved["project_id"] == "test-project"
 
-    def test_save_report_custom_path(self, mock_project, tmp_path):
+    def test_save_report_custom_path(self, shared_checker, prebuilt_report, tmp_path):
         """Should save report to custom path."""
-        checker = FactChecker(mock_project, use_mock=True)
-        report = checker.run_fact_check()
-
         custom_path = tmp_path / "custom_report.json"
-        output_path = checker.save_report(report, output_path=custom_path)
+        output_path = shared_checker.save_report(prebuilt_report, output_path=custom_path)
         assert output_path == custom_path
         assert custom_path.exists()
 
-    def test_parse_json_from_response_plain(self, mock_project):
+    def test_parse_json_from_response_plain(self, shared_checker):
         """Should parse plain JSON response."""
-        checker = FactChecker(mock_project, use_mock=True)
         response = '{"issues": [], "summary": {"total_issues": 0}}'
-        result = checker._parse_json_from_response(response)
+        result = shared_checker._parse_json_from_response(response)
         assert result["summary"]["total_issues"] == 0
 
-    def test_parse_json_from_response_markdown(self, mock_project):
+    def test_parse_json_from_response_markdown(self, shared_checker):
         """Should parse JSON from markdown code block."""
-        checker = FactChecker(mock_project, use_mock=True)
         response = """Here is the analysis:
 
 ```json
@@ -523,14 +663,13 @@ More detailed information about the subject.
 ```
 
 End of analysis."""
-        result = checker._parse_json_from_response(response)
+        result = shared_checker._parse_json_from_response(response)
         assert result["summary"]["total_issues"] == 0
 
-    def test_parse_json_from_response_invalid(self, mock_project):
+    def test_parse_json_from_response_invalid(self, shared_checker):
         """Should raise error for invalid JSON."""
-        checker = FactChecker(mock_project, use_mock=True)
         with pytest.raises(FactCheckError, match="Failed to parse"):
-            checker._parse_json_from_response("not valid json")
+            shared_checker._parse_json_from_response("not valid json")
 
     def test_verbose_logging(self, mock_project, capsys):
         """Should log progress when verbose."""
@@ -549,35 +688,21 @@ class TestRunFactCheckFunction:
     @pytest.fixture
     def mock_project(self, tmp_path):
         """Create a minimal mock project."""
-        project_dir = tmp_path / "test-project"
-        project_dir.mkdir()
-
-        # Config
-        with open(project_dir / "config.json", "w") as f:
-            json.dump({"id": "test-project", "title": "Test"}, f)
-
-        # Input
-        input_dir = project_dir / "input"
-        input_dir.mkdir()
-        (input_dir / "source.md").write_text("# Source\n\nContent here.")
-
-        # Script
-        script_dir = project_dir / "script"
-        script_dir.mkdir()
-        with open(script_dir / "script.json", "w") as f:
-            json.dump({"title": "Test", "scenes": []}, f)
-
-        # Narrations
-        narration_dir = project_dir / "narration"
-        narration_dir.mkdir()
-        with open(narration_dir / "narrations.json", "w") as f:
-            json.dump({"scenes": []}, f)
-
-        project = MagicMock()
-        project.id = "test-project"
-        project.title = "Test"
-        project.root_dir = project_dir
-        project.input_dir = input_dir
+        spec = ProjectSpec(
+            id="test-project",
+            title="Test",
+            script={"title": "Test", "scenes": []},
+            narrations={"scenes": []},
+            source_files={"source.md": "# Source\n\nContent here."},
+        )
+        project_dir = _build_project(tmp_path, spec)
+
+        project = SimpleNamespace(
+            id="test-project",
+            title="Test",
+            root_dir=project_dir,
+            input_dir=project_dir / "input",
+        )
 
         return project
 
@@ -588,75 +713,59 @@ class TestRunFactCheckFunction:
         assert report.project_id == "test-project"
 
 
+def _make_args(projects_dir, **overrides):
+    """Build cmd_factcheck arguments for the CLI test project."""
+    args = {
+        "projects_dir": str(projects_dir),
+        "project": "cli-project",
+        "mock": True,
+        "verbose": False,
+        "timeout": 60,
+        "no_save": True,
+    }
+    args.update(overrides)
+    return SimpleNamespace(**args)
+
+
+@pytest.mark.xdist_group("factcheck_io")
 class TestFactCheckCLI:
     """Tests for fact check CLI command."""
 
     @pytest.fixture
-    def cli_project(self, tmp_path):
-        """Create a project for CLI testing."""
-        project_dir = tmp_path / "cli-project"
-        project_dir.mkdir()
-
-        # Config
-        with open(project_dir / "config.json", "w") as f:
-            json.dump({"id": "cli-project", "title": "CLI Test"}, f)
-
-        # Input
-        input_dir = project_dir / "input"
-        input_dir.mkdir()
-        (input_dir / "source.md").write_text("# Source\n\nTest content.")
-
-        # Script
-        script_dir = project_dir / "script"
-        script_dir.mkdir()
-        with open(script_dir / "script.json", "w") as f:
-            json.dump({
-                "title": "CLI Test Script",
-                "scenes": [{"scene_id": "s1", "voiceover": "Test"}],
-            }, f)
-
-        # Narrations
-        narration_dir = project_dir / "narration"
-        narration_dir.mkdir()
-        with open(narration_dir / "narrations.json", "w") as f:
-            json.dump({
-                "scenes": [{"scene_id": "s1", "title": "Scene 1", "narration": "Test"}],
-            }, f)
-
-        return tmp_path
-
-    def test_cmd_factcheck_mock(self, cli_project, capsys):
-        """Should run fact check via CLI."""
+    def cli_project(self, request, cli_projects_template, tmp_path):
+        """Projects dir backed by the shared template.
+
+        Tests marked ``mutates_project`` get a private copy of the tree.
+        """
+        if request.node.get_closest_marker("mutates_project"):
+            return shutil.copytree(cli_projects_template, tmp_path / "projects")
+        return cli_projects_template
+
+    @pytest.mark.parametrize(
+        "verbose, expected_output",
+        [
+            (False, "FACT CHECK REPORT"),
+            (True, "Loading script"),
+        ],
+        ids=["default", "verbose"],
+    )
+    def test_cmd_factcheck_mock(self, cli_project, capsys, verbose, expected_output):
+        """Should run fact check via CLI, with progress output when --verbose."""
         from src.cli.main import cmd_factcheck
 
-        args = MagicMock()
-        args.projects_dir = str(cli_project)
-        args.project = "cli-project"
-        args.mock = True
-        args.verbose = False
-        args.timeout = 60
-        args.no_save = True
-
-        result = cmd_factcheck(args)
+        result = cmd_factcheck(_make_args(cli_project, verbose=verbose))
         assert result == 0
 
         captured = capsys.readouterr()
-        assert "FACT CHECK REPORT" in captured.out
+        assert expected_output in captured.out
         assert "cli-project" in captured.out
 
+    @pytest.mark.mutates_project
     def test_cmd_factcheck_saves_report(self, cli_project):
         """Should save report when --no-save not specified."""
         from src.cli.main import cmd_factcheck
 
-        args = MagicMock()
-        args.projects_dir = str(cli_project)
-        args.project = "cli-project"
-        args.mock = True
-        args.verbose = False
-        args.timeout = 60
-        args.no_save = False
-
-        result = cmd_factcheck(args)
+        result = cmd_factcheck(_make_args(cli_project, no_save=False))
         assert result == 0
 
         # Check report was saved
@@ -667,35 +776,18 @@ class TestFactCheckCLI:
         """Should fail for nonexistent project."""
         from src.cli.main import cmd_factcheck
 
-        args = MagicMock()
-        args.projects_dir = str(tmp_path)
-        args.project = "nonexistent"
-        args.mock = True
-        args.verbose = False
-        args.timeout = 60
-        args.no_save = True
-
-        result = cmd_factcheck(args)
+        result = cmd_factcheck(_make_args(tmp_path, project="nonexistent"))
         assert result == 1
 
         captured = capsys.readouterr()
         assert "Error" in captured.err
 
-    def test_cmd_factcheck_missing_script(self, cli_project, capsys):
+    @pytest.mark.parametrize("broken_project", ["no_script"], indirect=True)
+    def test_cmd_factcheck_missing_script(self, broken_project, capsys):
         """Should fail when script is missing."""
         from src.cli.main import cmd_factcheck
 
-        # Remove script
-        (cli_project / "cli-project" / "script" / "script.json").unlink()
-
-        args = MagicMock()
-        args.projects_dir = str(cli_project)
-        args.project = "cli-project"
-        args.mock = True
-        args.verbose = False
-        args.timeout = 60
-        args.no_save = True
-
+        args = _make_args(broken_project.root_dir.parent, project=broken_project.id)
         result = cmd_factcheck(args)
         assert result == 1
 
@@ -703,84 +795,33 @@ class TestFactCheckCLI:
         assert "Error" in captured.err
         assert "Script not found" in captured.err
 
-    def test_cmd_factcheck_verbose(self, cli_project, capsys):
-        """Should show verbose output when --verbose."""
-        from src.cli.main import cmd_factcheck
-
-        args = MagicMock()
-        args.projects_dir = str(cli_project)
-        args.project = "cli-project"
-        args.mock = True
-        args.verbose = True
-        args.timeout = 60
-        args.no_save = True
-
-        result = cmd_factcheck(args)
-        assert result == 0
-
-        captured = capsys.readouterr()
-        assert "Loading script" in captured.out
-
 
+@pytest.mark.pdf
+@pytest.mark.xdist_group("factcheck_io")
 class TestFactCheckWithPDF:
     """Tests for fact checking with PDF source material."""
 
     @pytest.fixture
-    def project_with_pdf(self, tmp_path):
+    def project_with_pdf(self, pdf_project_template):
         """Create a project with PDF source."""
-        import fitz  # PyMuPDF
-
-        project_dir = tmp_path / "pdf-project"
-        project_dir.mkdir()
-
-        # Config
-        with open(project_dir / "config.json", "w") as f:
-            json.dump({"id": "pdf-project", "title": "PDF Test"}, f)
-
-        # Create PDF source
-        input_dir = project_dir / "input"
-        input_dir.mkdir()
-
-        pdf_path = input_dir / "source.pdf"
-        doc = fitz.open()
-        page = doc.new_page()
-        page.insert_text((72, 72), "PDF Source Document\n\nThis is content from a PDF.")
-        doc.set_metadata({"title": "PDF Source"})
-        doc.save(str(pdf_path))
-        doc.close()
-
-        # Script
-        script_dir = project_dir / "script"
-        script_dir.mkdir()
-        with open(script_dir / "script.json", "w") as f:
-            json.dump({"title": "PDF Test", "scenes": []}, f)
-
-        # Narrations
-        narration_dir = project_dir / "narration"
-        narration_dir.mkdir()
-        with open(narration_dir / "narrations.json", "w") as f:
-            json.dump({"scenes": []}, f)
-
-        project = MagicMock()
-        project.id = "pdf-project"
-        project.title = "PDF Test"
-        project.root_dir = project_dir
-        project.input_dir = input_dir
+        project = SimpleNamespace(
+            id="pdf-project",
+            title="PDF Test",
+            root_dir=pdf_project_template,
+            input_dir=pdf_project_template / "input",
+        )
 
         return project
 
-    def test_load_pdf_source(self, project_with_pdf):
-        """Should load PDF as source material."""
+    def test_pdf_fact_check(self, project_with_pdf):
+        """Should load a PDF as source material and fact check against it."""
         checker = FactChecker(project_with_pdf, use_mock=True)
         content, names = checker._load_source_material()
 
         assert "source.pdf" in names
         assert "PDF Source Document" in content
 
-    def test_fact_check_with_pdf(self, project_with_pdf):
-        """Should run fact check with PDF source."""
-        checker = FactChecker(project_with_pdf, use_mock=True)
         report = checker.run_fact_check()
 
-        assert "source.pdf" in report.source_documents
         assert isinstance(report, FactCheckReport)
+        assert "source.pdf" in report.source_documents
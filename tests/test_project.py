@@ -1,6 +1,7 @@
 """Tests for project loader module."""
 
 import json
+import shutil
 from pathlib import Path
 
 import pytest
@@ -9,100 +10,101 @@ from src.project import Project, load_project, list_projects
 from src.project.loader import create_project
 
 
-class TestProjectLoader:
-    """Tests for project loading functionality."""
-
-    @pytest.fixture
-    def sample_project(self, tmp_path):
-        """Create a sample project for testing."""
-        project_dir = tmp_path / "test-project"
-        project_dir.mkdir()
-
-        # Create config
-        config = {
-            "id": "test-project",
-            "title": "Test Project",
-            "description": "A test project",
-            "version": "1.0.0",
-            "video": {
-                "resolution": {"width": 1920, "height": 1080},
-                "fps": 30,
-                "target_duration_seconds": 120,
-            },
-            "tts": {
-                "provider": "mock",
-                "voice_id": "test-voice",
+@pytest.fixture(scope="module")
+def sample_project(tmp_path_factory):
+    """Create a sample project once per module; tests must not modify it."""
+    project_dir = tmp_path_factory.mktemp("proj") / "test-project"
+    project_dir.mkdir()
+
+    # Create config
+    config = {
+        "id": "test-project",
+        "title": "Test Project",
+        "description": "A test project",
+        "version": "1.0.0",
+        "video": {
+            "resolution": {"width": 1920, "height": 1080},
+            "fps": 30,
+            "target_duration_seconds": 120,
+        },
+        "tts": {
+            "provider": "mock",
+            "voice_id": "test-voice",
+        },
+        "style": {
+            "background_color": "#000000",
+            "primary_color": "#ffffff",
+        },
+        "paths": {
+            "narration": "narration/narrations.json",
+            "storyboard": "storyboard/storyboard.json",
+            "voiceover_manifest": "voiceover/manifest.json",
+        },
+    }
+
+    config_path = project_dir / "config.json"
+    config_path.write_text(json.dumps(config))
+
+    # Create narration file
+    narration_dir = project_dir / "narration"
+    narration_dir.mkdir()
+    narrations = {
+        "scenes": [
+            {
+                "scene_id": "scene1",
+                "title": "Scene 1",
+                "duration_seconds": 10,
+                "narration": "This is scene one.",
             },
-            "style": {
-                "background_color": "#000000",
-                "primary_color": "#ffffff",
+            {
+                "scene_id": "scene2",
+                "title": "Scene 2",
+                "duration_seconds": 15,
+                "narration": "This is scene two.",
             },
-            "paths": {
-                "narration": "narration/narrations.json",
-                "storyboard": "storyboard/storyboard.json",
-                "voiceover_manifest": "voiceover/manifest.json",
-            },
-        }
-
-        config_path = project_dir / "config.json"
-        with open(config_path, "w") as f:
-            json.dump(config, f)
-
-        # Create narration file
-        narration_dir = project_dir / "narration"
-        narration_dir.mkdir()
-        narrations = {
-            "scenes": [
-                {
-                    "scene_id": "scene1",
-                    "title": "Scene 1",
-                    "duration_seconds": 10,
-                    "narration": "This is scene one.",
-                },
-                {
-                    "scene_id": "scene2",
-                    "title": "Scene 2",
-                    "duration_seconds": 15,
-                    "narration": "This is scene two.",
-                },
-            ]
-        }
-        with open(narration_dir / "narrations.json", "w") as f:
-            json.dump(narrations, f)
-
-        return project_dir
-
-    def test_load_project(self, sample_project):
-        """Test loading a project from directory."""
-        project = load_project(sample_project)
+        ]
+    }
+    (narration_dir / "narrations.json").write_text(json.dumps(narrations))
 
-        assert project.id == "test-project"
-        assert project.title == "Test Project"
-        assert project.description == "A test project"
-        assert project.version == "1.0.0"
+    return project_dir
 
-    def test_load_project_video_config(self, sample_project):
-        """Test that video config is loaded correctly."""
-        project = load_project(sample_project)
 
-        assert project.video.width == 1920
-        assert project.video.height == 1080
-        assert project.video.fps == 30
-        assert project.video.target_duration_seconds == 120
+@pytest.fixture(scope="module")
+def loaded_project(sample_project) -> Project:
+    """The sample project, loaded once and shared by read-only tests."""
+    return load_project(sample_project)
 
-    def test_load_project_tts_config(self, sample_project):
-        """Test that TTS config is loaded correctly."""
-        project = load_project(sample_project)
 
-        assert project.tts.provider == "mock"
-        assert project.tts.voice_id == "test-voice"
+@pytest.fixture
+def mutable_project(sample_project, tmp_path) -> Path:
+    """A private copy of the sample project for tests that write to it."""
+    return shutil.copytree(sample_project, tmp_path / "test-project")
 
-    def test_load_project_style_config(self, sample_project):
-        """Test that style config is loaded correctly."""
-        project = load_project(sample_project)
 
-        assert project.style.background_color == "#000000"
-        assert project.style.primary_color == "#ffffff"
+class TestProjectLoader:
+    """Tests for project loading functionality."""
+
+    def test_load_project(self, loaded_project):
+        """Test loading a project and its video, TTS and style config."""
+        project = loaded_project
+
+        assert (project.id, project.title, project.description, project.version) == (
+            "test-project",
+            "Test Project",
+            "A test project",
+            "1.0.0",
+        )
+        assert (
+            project.video.width,
+            project.video.height,
+            project.video.fps,
+            project.video.target_duration_seconds,
+        ) == (1920, 1080, 30, 120)
+        assert (project.tts.provider, project.tts.voice_id) == ("mock", "test-voice")
+        assert (project.style.background_color, project.style.primary_color) == (
+            "#000000",
+            "#ffffff",
+        )
 
     def test_load_project_from_config_file(self, sample_project):
         """Test loading project from config file path."""
@@ -116,37 +118,32 @@ class TestProjectLoader:
         with pytest.raises(FileNotFoundError):
             load_project(tmp_path / "nonexistent")
 
-    def test_project_directories(self, sample_project):
+    def test_project_directories(self, sample_project, loaded_project):
         """Test project directory properties."""
-        project = load_project(sample_project)
-
-        assert project.input_dir == sample_project / "input"
-        assert project.script_dir == sample_project / "script"
-        assert project.narration_dir == sample_project / "narration"
-        assert project.voiceover_dir == sample_project / "voiceover"
-        assert project.storyboard_dir == sample_project / "storyboard"
-        assert project.output_dir == sample_project / "output"
-
-    def test_load_narrations(self, sample_project):
+        assert loaded_project.input_dir == sample_project / "input"
+        assert loaded_project.script_dir == sample_project / "script"
+        assert loaded_project.narration_dir == sample_project / "narration"
+        assert loaded_project.voiceover_dir == sample_project / "voiceover"
+        assert loaded_project.storyboard_dir == sample_project / "storyboard"
+        assert loaded_project.output_dir == sample_project / "output"
+
+    def test_load_narrations(self, loaded_project):
         """Test loading narrations from project."""
-        project = load_project(sample_project)
-        narrations = project.load_narrations()
+        narrations = loaded_project.load_narrations()
 
         assert len(narrations) == 2
         assert narrations[0].scene_id == "scene1"
         assert narrations[0].title == "Scene 1"
         assert narrations[1].scene_id == "scene2"
 
-    def test_get_path(self, sample_project):
+    def test_get_path(self, sample_project, loaded_project):
         """Test getting paths from project config."""
-        project = load_project(sample_project)
-
-        narration_path = project.get_path("narration")
+        narration_path = loaded_project.get_path("narration")
         assert narration_path == sample_project / "narration" / "narrations.json"
 
-    def test_ensure_directories(self, sample_project):
+    def test_ensure_directories(self, mutable_project):
         """Test creating project directories."""
-        project = load_project(sample_project)
+        project = load_project(mutable_project)
         project.ensure_directories()
 
         assert project.input_dir.exists()
@@ -172,8 +169,7 @@ class TestListProjects:
             project_dir = tmp_path / name
             project_dir.mkdir()
             config = {"id": name, "title": name.title()}
-            with open(project_dir / "config.json", "w") as f:
-                json.dump(config, f)
+            (project_dir / "config.json").write_text(json.dumps(config))
 
         projects = list_projects(tmp_path)
 
@@ -223,37 +219,39 @@ class TestCreateProject:
             create_project("existing", "Existing", tmp_path)
 
 
+LLM_INFERENCE_PATH = Path("projects/llm-inference")
+
+
+@pytest.fixture(scope="module")
+def llm_inference_project() -> Project:
+    """The real llm-inference project, loaded once per module."""
+    return load_project(LLM_INFERENCE_PATH)
+
+
+@pytest.fixture(scope="module")
+def llm_inference_narrations(llm_inference_project):
+    """Narrations of the llm-inference project, loaded once per module."""
+    return llm_inference_project.load_narrations()
+
+
+@pytest.mark.skipif(
+    not LLM_INFERENCE_PATH.exists(), reason="llm-inference project not found"
+)
+@pytest.mark.xdist_group("llm_inference")
 class TestLLMInferenceProject:
     """Tests for the actual llm-inference project."""
 
-    def test_llm_inference_project_exists(self):
+    def test_llm_inference_project_exists(self, llm_inference_project):
         """Test that the llm-inference project can be loaded."""
-        project_path = Path("projects/llm-inference")
-        if not project_path.exists():
-            pytest.skip("llm-inference project not found")
-
-        project = load_project(project_path)
-        assert project.id == "llm-inference"
+        assert llm_inference_project.id == "llm-inference"
 
-    def test_llm_inference_narrations(self):
+    def test_llm_inference_narrations(self, llm_inference_narrations):
         """Test loading narrations from llm-inference project."""
-        project_path = Path("projects/llm-inference")
-        if not project_path.exists():
-            pytest.skip("llm-inference project not found")
+        assert len(llm_inference_narrations) == 18
+        assert llm_inference_narrations[0].scene_id == "scene1_hook"
 
-        project = load_project(project_path)
-        narrations = project.load_narrations()
-
-        assert len(narrations) == 18
-        assert narrations[0].scene_id == "scene1_hook"
-
-    def test_llm_inference_voiceover_files(self):
+    def test_llm_inference_voiceover_files(self, llm_inference_project):
         """Test voiceover files exist in llm-inference project."""
-        project_path = Path("projects/llm-inference")
-        if not project_path.exists():
-            pytest.skip("llm-inference project not found")
-
-        project = load_project(project_path)
-        voiceover_files = project.get_voiceover_files()
+        voiceover_files = llm_inference_project.get_voiceover_files()
 
         assert len(voiceover_files) == 18
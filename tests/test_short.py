@@ -1,6 +1,7 @@
 """Tests for YouTube Shorts generation module."""
 
 import json
+import shutil
 from pathlib import Path
 
 import pytest
@@ -12,6 +13,51 @@ from src.short.models import HookAnalysis, CondensedNarration, ShortResult, Shor
 from src.short.generator import normalize_script_format
 
 
+@pytest.fixture(scope="module")
+def module_mock_config() -> Config:
+    """Mock-provider config shared by the module- and class-scoped fixtures."""
+    config = Config()
+    config.llm.provider = "mock"
+    return config
+
+
+@pytest.fixture(scope="class")
+def short_generator(module_mock_config):
+    """ShortGenerator shared by the tests of one class."""
+    return ShortGenerator(config=module_mock_config)
+
+
+@pytest.fixture(scope="class")
+def short_scene_generator(module_mock_config):
+    """ShortSceneGenerator shared by the tests of one class."""
+    return ShortSceneGenerator(config=module_mock_config)
+
+
+@pytest.fixture(scope="module")
+def generated_scene_assets(tmp_path_factory, module_mock_config):
+    """Generate the vertical styles and CTA scene once for the template tests."""
+    generator = ShortSceneGenerator(config=module_mock_config)
+
+    scenes_dir = tmp_path_factory.mktemp("scenes")
+    return {
+        "scenes_dir": scenes_dir,
+        "styles": generator.generate_vertical_styles(scenes_dir, "Test Project"),
+        "cta": generator.generate_cta_scene(scenes_dir, "Test Project"),
+    }
+
+
+@pytest.fixture(scope="module")
+def styles_content(generated_scene_assets):
+    """Text of the generated vertical styles.ts."""
+    return generated_scene_assets["styles"].read_text()
+
+
+@pytest.fixture(scope="module")
+def cta_content(generated_scene_assets):
+    """Text of the generated CTAScene.tsx."""
+    return generated_scene_assets["cta"].read_text()
+
+
 class TestShortModels:
     """Tests for short data models."""
 
@@ -121,10 +167,6 @@ class TestShortModels:
 class TestShortGenerator:
     """Tests for the short generator."""
 
-    @pytest.fixture
-    def generator(self, mock_config):
-        return ShortGenerator(config=mock_config)
-
     @pytest.fixture
     def sample_script(self) -> Script:
         """Create a sample script for testing."""
@@ -198,22 +240,22 @@ class TestShortGenerator:
             },
         ]
 
-    def test_generator_initializes(self, generator):
-        assert generator.config is not None
-        assert generator.llm is not None
+    def test_generator_initializes(self, short_generator):
+        assert short_generator.config is not None
+        assert short_generator.llm is not None
 
-    def test_analyze_for_hook(self, generator, sample_script, sample_narrations):
-        result = generator.analyze_for_hook(sample_script, sample_narrations)
+    def test_analyze_for_hook(self, short_generator, sample_script, sample_narrations):
+        result = short_generator.analyze_for_hook(sample_script, sample_narrations)
         assert isinstance(result, HookAnalysis)
         # Mock LLM may return empty scene_ids, but result should be valid
         assert isinstance(result.selected_scene_ids, list)
         assert result.hook_question is not None
 
     def test_generate_condensed_narration(
-        self, generator, sample_script, sample_narrations
+        self, short_generator, sample_script, sample_narrations
     ):
         selected_ids = ["scene1_surprising_discovery", "scene2_challenge"]
-        result = generator.generate_condensed_narration(
+        result = short_generator.generate_condensed_narration(
             sample_script,
             sample_narrations,
             selected_ids,
@@ -223,8 +265,8 @@ class TestShortGenerator:
         assert result.condensed_narration is not None
         assert result.cta_narration is not None
 
-    def test_generate_mock_short_script(self, generator):
-        script = generator.generate_mock_short_script(
+    def test_generate_mock_short_script(self, short_generator):
+        script = short_generator.generate_mock_short_script(
             project_id="test-project",
             topic="Machine Learning",
             duration=45,
@@ -235,13 +277,13 @@ class TestShortGenerator:
         assert len(script.scenes) >= 1
         assert script.total_duration_seconds == 45
 
-    def test_save_and_load_short_script(self, generator, tmp_path):
-        script = generator.generate_mock_short_script(
+    def test_save_and_load_short_script(self, short_generator, tmp_path):
+        script = short_generator.generate_mock_short_script(
             project_id="test",
             topic="Test Topic",
         )
         script_path = tmp_path / "short_script.json"
-        generator.save_short_script(script, script_path)
+        short_generator.save_short_script(script, script_path)
 
         assert script_path.exists()
 
@@ -254,10 +296,6 @@ class TestShortGenerator:
 class TestShortSceneGenerator:
     """Tests for the vertical scene generator."""
 
-    @pytest.fixture
-    def generator(self, mock_config):
-        return ShortSceneGenerator(config=mock_config)
-
     @pytest.fixture
     def sample_short_script(self) -> ShortScript:
         return ShortScript(
@@ -276,45 +314,29 @@ class TestShortSceneGenerator:
             total_duration_seconds=45.0,
         )
 
-    def test_generator_initializes(self, generator):
-        assert generator.config is not None
-
-    def test_generate_vertical_styles(self, generator, tmp_path):
-        scenes_dir = tmp_path / "scenes"
-        scenes_dir.mkdir()
-
-        styles_path = generator.generate_vertical_styles(
-            scenes_dir, "Test Project"
-        )
+    def test_generator_initializes(self, short_scene_generator):
+        assert short_scene_generator.config is not None
 
-        assert styles_path.exists()
-        content = styles_path.read_text()
+    def test_generate_vertical_styles(self, generated_scene_assets, styles_content):
+        assert generated_scene_assets["styles"].exists()
 
         # Check for vertical-specific values
-        assert "CANVAS_WIDTH = 1080" in content
-        assert "CANVAS_HEIGHT = 1920" in content
-        assert "LAYOUT" in content
-        assert "COLORS" in content
-        assert "FONTS" in content
+        assert "CANVAS_WIDTH = 1080" in styles_content
+        assert "CANVAS_HEIGHT = 1920" in styles_content
+        assert "LAYOUT" in styles_content
+        assert "COLORS" in styles_content
+        assert "FONTS" in styles_content
 
-    def test_generate_cta_scene(self, generator, tmp_path):
-        scenes_dir = tmp_path / "scenes"
-        scenes_dir.mkdir()
-
-        cta_path = generator.generate_cta_scene(
-            scenes_dir, "Test Project"
-        )
-
-        assert cta_path.exists()
-        content = cta_path.read_text()
+    def test_generate_cta_scene(self, generated_scene_assets, cta_content):
+        assert generated_scene_assets["cta"].exists()
 
         # Check for CTA-specific content
-        assert "CTAScene" in content
-        assert "hookQuestion" in content
-        assert "ctaText" in content
-        assert "thumbnailUrl" in content
+        assert "CTAScene" in cta_content
+        assert "hookQuestion" in cta_content
+        assert "ctaText" in cta_content
+        assert "thumbnailUrl" in cta_content
 
-    def test_generate_index(self, generator, tmp_path):
+    def test_generate_index(self, short_scene_generator, tmp_path):
         scenes_dir = tmp_path / "scenes"
         scenes_dir.mkdir()
 
@@ -323,7 +345,7 @@ class TestShortSceneGenerator:
             {"name": "HookScene", "filename": "HookScene.tsx", "scene_key": "hook"},
         ]
 
-        index_path = generator.generate_index(
+        index_path = short_scene_generator.generate_index(
             scenes_dir, "Test Project", scene_components
         )
 
@@ -335,7 +357,7 @@ class TestShortSceneGenerator:
         assert "CTAScene" in content
         assert "HookScene" in content
 
-    def test_setup_short_scenes(self, generator, sample_short_script, tmp_path):
+    def test_setup_short_scenes(self, short_scene_generator, sample_short_script, tmp_path):
         # Create a mock project-like structure
         project_dir = tmp_path / "test-project"
         project_dir.mkdir()
@@ -347,7 +369,7 @@ class TestShortSceneGenerator:
 
         project = MockProject()
 
-        paths = generator.setup_short_scenes(
+        paths = short_scene_generator.setup_short_scenes(
             project, sample_short_script, variant="default"
         )
 
@@ -357,79 +379,82 @@ class TestShortSceneGenerator:
         assert paths["index_path"].exists()
 
 
-class TestShortGeneratorIntegration:
-    """Integration tests for short generation with mock project."""
-
-    @pytest.fixture
-    def mock_project_dir(self, tmp_path):
-        """Create a mock project directory with required files."""
-        project_dir = tmp_path / "test-project"
-        project_dir.mkdir()
+@pytest.fixture(scope="module")
+def short_project_template(tmp_path_factory):
+    """Build the mock project for short generation once; copy it before use."""
+    project_dir = tmp_path_factory.mktemp("short_tpl") / "test-project"
+    project_dir.mkdir()
+
+    # Create config
+    config = {
+        "id": "test-project",
+        "title": "Test Project",
+        "description": "A test project",
+        "version": "1.0.0",
+        "video": {
+            "resolution": {"width": 1920, "height": 1080},
+            "fps": 30,
+        },
+        "tts": {"provider": "mock"},
+        "style": {},
+        "paths": {
+            "script": "script/script.json",
+            "narration": "narration/narrations.json",
+        },
+    }
+    (project_dir / "config.json").write_text(json.dumps(config))
+
+    # Create script
+    script_dir = project_dir / "script"
+    script_dir.mkdir()
+    script = {
+        "title": "Test Video",
+        "total_duration_seconds": 120,
+        "scenes": [
+            {
+                "scene_id": 1,
+                "scene_type": "hook",
+                "title": "The Hook",
+                "voiceover": "Amazing discovery!",
+                "visual_cue": {
+                    "description": "Reveal",
+                    "visual_type": "animation",
+                    "elements": [],
+                    "duration_seconds": 15,
+                },
+                "duration_seconds": 15,
+            }
+        ],
+        "source_document": "test.md",
+    }
+    (script_dir / "script.json").write_text(json.dumps(script))
+
+    # Create narrations
+    narration_dir = project_dir / "narration"
+    narration_dir.mkdir()
+    narrations = {
+        "scenes": [
+            {
+                "scene_id": "scene1_hook",
+                "title": "The Hook",
+                "duration_seconds": 15,
+                "narration": "This is an amazing discovery that will change everything.",
+            }
+        ],
+        "total_duration_seconds": 15,
+    }
+    (narration_dir / "narrations.json").write_text(json.dumps(narrations))
 
-        # Create config
-        config = {
-            "id": "test-project",
-            "title": "Test Project",
-            "description": "A test project",
-            "version": "1.0.0",
-            "video": {
-                "resolution": {"width": 1920, "height": 1080},
-                "fps": 30,
-            },
-            "tts": {"provider": "mock"},
-            "style": {},
-            "paths": {
-                "script": "script/script.json",
-                "narration": "narration/narrations.json",
-            },
-        }
-        with open(project_dir / "config.json", "w") as f:
-            json.dump(config, f)
+    return project_dir
 
-        # Create script
-        script_dir = project_dir / "script"
-        script_dir.mkdir()
-        script = {
-            "title": "Test Video",
-            "total_duration_seconds": 120,
-            "scenes": [
-                {
-                    "scene_id": 1,
-                    "scene_type": "hook",
-                    "title": "The Hook",
-                    "voiceover": "Amazing discovery!",
-                    "visual_cue": {
-                        "description": "Reveal",
-                        "visual_type": "animation",
-                        "elements": [],
-                        "duration_seconds": 15,
-                    },
-                    "duration_seconds": 15,
-                }
-            ],
-            "source_document": "test.md",
-        }
-        with open(script_dir / "script.json", "w") as f:
-            json.dump(script, f)
 
-        # Create narrations
-        narration_dir = project_dir / "narration"
-        narration_dir.mkdir()
-        narrations = {
-            "scenes": [
-                {
-                    "scene_id": "scene1_hook",
-                    "title": "The Hook",
-                    "duration_seconds": 15,
-                    "narration": "This is an amazing discovery that will change everything.",
-                }
-            ],
-            "total_duration_seconds": 15,
-        }
-        with open(narration_dir / "narrations.json", "w") as f:
-            json.dump(narrations, f)
+class TestShortGeneratorIntegration:
+    """Integration tests for short generation with mock project."""
 
-        return project_dir
+    @pytest.fixture
+    def mock_project_dir(self, short_project_template, tmp_path):
+        """Private copy of the mock project; generate_short writes into it."""
+        return shutil.copytree(short_project_template, tmp_path / "test-project")
 
     def test_generate_short_with_mock_project(self, mock_project_dir, mock_config):
         from src.project import load_project
@@ -488,71 +513,39 @@ class TestShortGeneratorIntegration:
 class TestVerticalStylesTemplate:
     """Tests for the vertical styles template content."""
 
-    @pytest.fixture
-    def generator(self, mock_config):
-        return ShortSceneGenerator(config=mock_config)
-
-    def test_vertical_layout_dimensions(self, generator, tmp_path):
-        scenes_dir = tmp_path / "scenes"
-        scenes_dir.mkdir()
-
-        styles_path = generator.generate_vertical_styles(scenes_dir, "Test")
-        content = styles_path.read_text()
-
+    def test_vertical_layout_dimensions(self, styles_content):
         # Verify vertical-specific dimensions
-        assert "CANVAS_WIDTH = 1080" in content
-        assert "CANVAS_HEIGHT = 1920" in content
+        assert "CANVAS_WIDTH = 1080" in styles_content
+        assert "CANVAS_HEIGHT = 1920" in styles_content
 
         # Verify margins are adjusted for vertical
-        assert "MARGIN_LEFT = 40" in content
-        assert "MARGIN_RIGHT = 40" in content
-
-    def test_vertical_layout_helpers(self, generator, tmp_path):
-        scenes_dir = tmp_path / "scenes"
-        scenes_dir.mkdir()
-
-        styles_path = generator.generate_vertical_styles(scenes_dir, "Test")
-        content = styles_path.read_text()
+        assert "MARGIN_LEFT = 40" in styles_content
+        assert "MARGIN_RIGHT = 40" in styles_content
 
+    def test_vertical_layout_helpers(self, styles_content):
         # Verify layout helpers exist
-        assert "getFlexibleGrid" in content
-        assert "getCenteredPosition" in content
-        assert "getTwoColumnLayout" in content
-        assert "getTwoRowLayout" in content
-        assert "getThreeRowLayout" in content  # Vertical-specific
+        assert "getFlexibleGrid" in styles_content
+        assert "getCenteredPosition" in styles_content
+        assert "getTwoColumnLayout" in styles_content
+        assert "getTwoRowLayout" in styles_content
+        assert "getThreeRowLayout" in styles_content  # Vertical-specific
 
 
 class TestCTASceneTemplate:
     """Tests for the CTA scene template content."""
 
-    @pytest.fixture
-    def generator(self, mock_config):
-        return ShortSceneGenerator(config=mock_config)
-
-    def test_cta_scene_props(self, generator, tmp_path):
-        scenes_dir = tmp_path / "scenes"
-        scenes_dir.mkdir()
-
-        cta_path = generator.generate_cta_scene(scenes_dir, "Test")
-        content = cta_path.read_text()
-
+    def test_cta_scene_props(self, cta_content):
         # Verify props
-        assert "hookQuestion" in content
-        assert "ctaText" in content
-        assert "thumbnailUrl" in content
-        assert "channelName" in content
-
-    def test_cta_scene_animations(self, generator, tmp_path):
-        scenes_dir = tmp_path / "scenes"
-        scenes_dir.mkdir()
-
-        cta_path = generator.generate_cta_scene(scenes_dir, "Test")
-        content = cta_path.read_text()
+        assert "hookQuestion" in cta_content
+        assert "ctaText" in cta_content
+        assert "thumbnailUrl" in cta_content
+        assert "channelName" in cta_content
 
+    def test_cta_scene_animations(self, cta_content):
         # Verify animation functions
-        assert "useCurrentFrame" in content
-        assert "interpolate" in content
-        assert "spring" in content
+        assert "useCurrentFrame" in cta_content
+        assert "interpolate" in cta_content
+        assert "spring" in cta_content
 
 
 class TestNormalizeScriptFormat:
@@ -689,10 +682,6 @@ class TestNormalizeScriptFormat:
 class TestCTABeatTiming:
     """Tests for CTA beat timing edge cases."""
 
-    @pytest.fixture
-    def generator(self, mock_config):
-        return ShortGenerator(config=mock_config)
-
     @pytest.fixture
     def sample_short_script(self) -> ShortScript:
         return ShortScript(
@@ -711,7 +700,7 @@ class TestCTABeatTiming:
             total_duration_seconds=45.0,
         )
 
-    def test_cta_timing_with_gap(self, generator, sample_short_script):
+    def test_cta_timing_with_gap(self, short_generator, sample_short_script):
         """Test CTA beat is created with gap when voiceover ends early."""
         word_timestamps = [
             {"word": "Test", "start_seconds": 0.0, "end_seconds": 0.5},
@@ -721,7 +710,7 @@ class TestCTABeatTiming:
         ]
         voiceover_duration = 5.0  # Plenty of time after last word
 
-        storyboard = generator.generate_shorts_storyboard_from_voiceover(
+        storyboard = short_generator.generate_shorts_storyboard_from_voiceover(
             sample_short_script,
             word_timestamps,
             voiceover_duration,
@@ -737,7 +726,7 @@ class TestCTABeatTiming:
         # Verify timing is valid
         assert cta_beat.start_seconds < cta_beat.end_seconds
 
-    def test_cta_timing_near_end(self, generator, sample_short_script):
+    def test_cta_timing_near_end(self, short_generator, sample_short_script):
         """Test CTA timing when voiceover ends near total duration."""
         # Voiceover ends at 19.5s, duration is 20.0s
         word_timestamps = [
@@ -748,7 +737,7 @@ class TestCTABeatTiming:
         ]
         voiceover_duration = 20.0
 
-        storyboard = generator.generate_shorts_storyboard_from_voiceover(
+        storyboard = short_generator.generate_shorts_storyboard_from_voiceover(
             sample_short_script,
             word_timestamps,
             voiceover_duration,
@@ -763,7 +752,7 @@ class TestCTABeatTiming:
         # CTA end should be voiceover_duration
         assert cta_beat.end_seconds == voiceover_duration
 
-    def test_cta_timing_voiceover_fills_duration(self, generator, sample_short_script):
+    def test_cta_timing_voiceover_fills_duration(self, short_generator, sample_short_script):
         """Test CTA beat when voiceover completely fills the duration."""
         # Last word ends at exactly the voiceover duration
         word_timestamps = [
@@ -774,7 +763,7 @@ class TestCTABeatTiming:
         ]
         voiceover_duration = 20.0
 
-        storyboard = generator.generate_shorts_storyboard_from_voiceover(
+        storyboard = short_generator.generate_shorts_storyboard_from_voiceover(
             sample_short_script,
             word_timestamps,
             voiceover_duration,
@@ -788,7 +777,7 @@ class TestCTABeatTiming:
             assert cta_beat.start_seconds < cta_beat.end_seconds
         # If no CTA beat, that's also acceptable when there's no time
 
-    def test_no_cta_when_no_time(self, generator, sample_short_script):
+    def test_no_cta_when_no_time(self, short_generator, sample_short_script):
         """Test that CTA is not added when there's no time for it."""
         # Last word ends after voiceover duration (edge case)
         word_timestamps = [
@@ -797,7 +786,7 @@ class TestCTABeatTiming:
         ]
         voiceover_duration = 20.0  # Less than last word end
 
-        storyboard = generator.generate_shorts_storyboard_from_voiceover(
+        storyboard = short_generator.generate_shorts_storyboard_from_voiceover(
             sample_short_script,
             word_timestamps,
             voiceover_duration,
@@ -809,7 +798,7 @@ class TestCTABeatTiming:
         if cta_beat is not None:
             assert cta_beat.start_seconds < cta_beat.end_seconds
 
-    def test_all_beats_have_valid_timing(self, generator, sample_short_script):
+    def test_all_beats_have_valid_timing(self, short_generator, sample_short_script):
         """Test that all beats (including CTA) have valid start < end timing."""
         word_timestamps = [
             {"word": "Test", "start_seconds": 0.0, "end_seconds": 0.5},
@@ -817,7 +806,7 @@ class TestCTABeatTiming:
         ]
         voiceover_duration = 2.0
 
-        storyboard = generator.generate_shorts_storyboard_from_voiceover(
+        storyboard = short_generator.generate_shorts_storyboard_from_voiceover(
             sample_short_script,
             word_timestamps,
             voiceover_duration,
@@ -2,6 +2,7 @@
 
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from src.audio.transcribe import (
@@ -14,6 +15,38 @@ from src.audio.transcribe import (
 from src.audio.tts import WordTimestamp
 
 
+@pytest.fixture(scope="module")
+def dummy_audio(tmp_path_factory):
+    """A placeholder audio file for tests that mock out the actual decoding."""
+    audio_file = tmp_path_factory.mktemp("audio") / "test.mp3"
+    audio_file.write_bytes(b"\x00" * 1000)
+    return audio_file
+
+
+@pytest.fixture(scope="module")
+def mock_whisper():
+    """A stub whisper module whose model returns a fixed two-word transcription."""
+    whisper = MagicMock()
+    model = MagicMock()
+    model.transcribe.return_value = {
+        "text": "Hello world",
+        "language": "en",
+        "segments": [
+            {
+                "text": "Hello world",
+                "start": 0.0,
+                "end": 1.0,
+                "words": [
+                    {"word": "Hello", "start": 0.0, "end": 0.4},
+                    {"word": "world", "start": 0.5, "end": 1.0},
+                ],
+            }
+        ],
+    }
+    whisper.load_model.return_value = model
+    return whisper
+
+
 class TestTranscriptionResult:
     """Tests for TranscriptionResult dataclass."""
 
@@ -61,43 +94,18 @@ class TestWhisperTranscriber:
         assert transcriber.model_name == "small"
         assert transcriber.device == "cpu"
 
-    @patch("src.audio.transcribe.WhisperTranscriber._load_model")
-    def test_transcribe_file_not_found(self, mock_load):
+    def test_transcribe_file_not_found(self):
         """Test that transcribe raises error for missing file."""
         transcriber = WhisperTranscriber()
 
         with pytest.raises(FileNotFoundError):
             transcriber.transcribe("/nonexistent/audio.mp3")
 
-    def test_transcribe_success(self, tmp_path):
+    def test_transcribe_success(self, dummy_audio, mock_whisper):
         """Test successful transcription with mocked whisper."""
-        # Create a dummy audio file
-        audio_file = tmp_path / "test.mp3"
-        audio_file.write_bytes(b"\x00" * 1000)
-
-        # Mock whisper module
-        mock_whisper = MagicMock()
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = {
-            "text": "Hello world",
-            "language": "en",
-            "segments": [
-                {
-                    "text": "Hello world",
-                    "start": 0.0,
-                    "end": 1.0,
-                    "words": [
-                        {"word": "Hello", "start": 0.0, "end": 0.4},
-                        {"word": "world", "start": 0.5, "end": 1.0},
-                    ],
-                }
-            ],
-        }
-        mock_whisper.load_model.return_value = mock_model
-
         with patch.dict("sys.modules", {"whisper": mock_whisper}):
             transcriber = WhisperTranscriber()
-            result = transcriber.transcribe(audio_file)
+            result = transcriber.transcribe(dummy_audio)
 
             assert result.text == "Hello world"
             assert len(result.word_timestamps) == 2
@@ -138,49 +146,41 @@ class TestGetAudioDuration:
         with pytest.raises(FileNotFoundError):
             get_audio_duration("/nonexistent/audio.mp3")
 
-    @patch("subprocess.run")
-    def test_successful_duration(self, mock_run, tmp_path):
+    @patch("subprocess.run", return_value=SimpleNamespace(returncode=0, stdout="10.5\n"))
+    def test_successful_duration(self, mock_run, dummy_audio):
         """Test getting duration successfully."""
-        audio_file = tmp_path / "test.mp3"
-        audio_file.write_bytes(b"\x00" * 1000)
-
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="10.5\n",
-        )
-
-        duration = get_audio_duration(audio_file)
+        duration = get_audio_duration(dummy_audio)
         assert duration == 10.5
 
-    @patch("subprocess.run")
-    def test_ffprobe_failure(self, mock_run, tmp_path):
+    @patch("subprocess.run", return_value=SimpleNamespace(returncode=1, stdout=""))
+    def test_ffprobe_failure(self, mock_run, dummy_audio):
         """Test error when ffprobe fails."""
-        audio_file = tmp_path / "test.mp3"
-        audio_file.write_bytes(b"\x00" * 1000)
+        with pytest.raises(RuntimeError):
+            get_audio_duration(dummy_audio)
 
-        mock_run.return_value = MagicMock(
-            returncode=1,
-            stdout="",
-        )
 
-        with pytest.raises(RuntimeError):
-            get_audio_duration(audio_file)
+@pytest.fixture(scope="class")
+def stub_whisper_modules():
+    """Install stub whisper and faster_whisper modules for a whole test class."""
+    with patch.dict(
+        "sys.modules", {"whisper": MagicMock(), "faster_whisper": MagicMock()}
+    ):
+        yield
 
 
+@pytest.mark.usefixtures("stub_whisper_modules")
 class TestGetTranscriber:
     """Tests for get_transcriber factory function."""
 
     def test_explicit_whisper_backend(self):
         """Test selecting whisper backend explicitly."""
-        with patch.dict("sys.modules", {"whisper": MagicMock()}):
-            transcriber = get_transcriber(backend="whisper")
-            assert isinstance(transcriber, WhisperTranscriber)
+        transcriber = get_transcriber(backend="whisper")
+        assert isinstance(transcriber, WhisperTranscriber)
 
     def test_explicit_faster_whisper_backend(self):
         """Test selecting faster-whisper backend explicitly."""
-        with patch.dict("sys.modules", {"faster_whisper": MagicMock()}):
-            transcriber = get_transcriber(backend="faster-whisper")
-            assert isinstance(transcriber, FasterWhisperTranscriber)
+        transcriber = get_transcriber(backend="faster-whisper")
+        assert isinstance(transcriber, FasterWhisperTranscriber)
 
     def test_unknown_backend_raises(self):
         """Test that unknown backend raises ValueError."""
@@ -189,11 +189,10 @@ class TestGetTranscriber:
 
     def test_custom_model_and_device(self):
         """Test passing custom model and device."""
-        with patch.dict("sys.modules", {"whisper": MagicMock()}):
-            transcriber = get_transcriber(
-                backend="whisper",
-                model="medium",
-                device="cpu",
-            )
-            assert transcriber.model_name == "medium"
-            assert transcriber.device == "cpu"
+        transcriber = get_transcriber(
+            backend="whisper",
+            model="medium",
+            device="cpu",
+        )
+        assert transcriber.model_name == "medium"
+        assert transcriber.device == "cpu"
@@ -547,6 +547,7 @@ class TestRealWorldUrl:
     """Integration tests with real URLs (marked as slow)."""
 
     @pytest.mark.slow
+    @pytest.mark.xdist_group("network")
     def test_parses_real_webpage(self):
         """Should parse a real webpage (requires network)."""
         # Using a stable, well-structured page
@@ -23,9 +23,9 @@ from src.config import TTSConfig
 class TestNarration:
     """Tests for narration loading module."""
 
-    @pytest.fixture
-    def sample_narrations_file(self, tmp_path):
-        """Create a sample narrations JSON file."""
+    @pytest.fixture(scope="module")
+    def sample_narrations_file(self, tmp_path_factory):
+        """Create a sample narrations JSON file once per module."""
         narrations_data = {
             "scenes": [
                 {
@@ -49,14 +49,18 @@ class TestNarration:
             ],
             "total_duration_seconds": 55,
         }
-        narration_path = tmp_path / "narrations.json"
-        with open(narration_path, "w") as f:
-            json.dump(narrations_data, f)
+        narration_path = tmp_path_factory.mktemp("narration") / "narrations.json"
+        narration_path.write_text(json.dumps(narrations_data))
         return narration_path
 
-    def test_load_narrations_from_file(self, sample_narrations_file):
+    @pytest.fixture(scope="module")
+    def sample_narrations(self, sample_narrations_file):
+        """The sample narrations, loaded once and shared by read-only tests."""
+        return load_narrations_from_file(sample_narrations_file)
+
+    def test_load_narrations_from_file(self, sample_narrations):
         """Test loading narrations from a JSON file."""
-        narrations = load_narrations_from_file(sample_narrations_file)
+        narrations = sample_narrations
 
         assert len(narrations) == 3
         assert narrations[0].scene_id == "scene1"
@@ -84,35 +88,37 @@ class TestNarration:
                 },
             ],
         }
-        with open(narration_dir / "narrations.json", "w") as f:
-            json.dump(narrations_data, f)
+        (narration_dir / "narrations.json").write_text(json.dumps(narrations_data))
 
         narrations = load_narrations_from_project(tmp_path)
         assert len(narrations) == 1
         assert narrations[0].scene_id == "test"
 
-    def test_scene_narration_fields(self, sample_narrations_file):
+    def test_scene_narration_fields(self, sample_narrations):
         """Verify SceneNarration has all required fields."""
-        narrations = load_narrations_from_file(sample_narrations_file)
-
-        for narration in narrations:
+        for narration in sample_narrations:
             assert narration.scene_id, "scene_id should not be empty"
             assert narration.title, "title should not be empty"
             assert narration.duration_seconds > 0, "duration should be positive"
             assert narration.narration, "narration text should not be empty"
 
 
+@pytest.fixture(scope="module")
+def voiceover_audio(tmp_path_factory) -> Path:
+    """An empty audio file shared by the voiceover data class tests."""
+    audio_path = tmp_path_factory.mktemp("voiceover") / "test.mp3"
+    audio_path.touch()
+    return audio_path
+
+
 class TestSceneVoiceover:
     """Tests for SceneVoiceover data class."""
 
-    def test_to_dict(self, tmp_path):
+    def test_to_dict(self, voiceover_audio):
         """Test converting SceneVoiceover to dict."""
-        audio_path = tmp_path / "test.mp3"
-        audio_path.touch()
-
         voiceover = SceneVoiceover(
             scene_id="test_scene",
-            audio_path=audio_path,
+            audio_path=voiceover_audio,
             duration_seconds=10.5,
             word_timestamps=[
                 WordTimestamp(word="hello", start_seconds=0.0, end_seconds=0.5),
@@ -130,29 +136,26 @@ class TestSceneVoiceover:
 class TestVoiceoverResult:
     """Tests for VoiceoverResult data class."""
 
-    @pytest.fixture
-    def sample_result(self, tmp_path):
-        """Create a sample VoiceoverResult."""
-        audio_path = tmp_path / "test.mp3"
-        audio_path.touch()
-
+    @pytest.fixture(scope="module")
+    def sample_result(self, voiceover_audio):
+        """Create a sample VoiceoverResult once; tests must not modify it."""
         return VoiceoverResult(
             scenes=[
                 SceneVoiceover(
                     scene_id="scene1",
-                    audio_path=audio_path,
+                    audio_path=voiceover_audio,
                     duration_seconds=10.0,
                     word_timestamps=[],
                 ),
                 SceneVoiceover(
                     scene_id="scene2",
-                    audio_path=audio_path,
+                    audio_path=voiceover_audio,
                     duration_seconds=15.0,
                     word_timestamps=[],
                 ),
             ],
             total_duration_seconds=25.0,
-            output_dir=tmp_path,
+            output_dir=voiceover_audio.parent,
         )
 
     def test_to_dict(self, sample_result):
@@ -162,18 +165,17 @@ class TestVoiceoverResult:
         assert data["total_duration_seconds"] == 25.0
         assert "output_dir" in data
 
-    def test_save_manifest(self, sample_result, tmp_path):
+    def test_save_manifest(self, sample_result):
         """Test saving manifest to file."""
         manifest_path = sample_result.save_manifest()
         assert manifest_path.exists()
         assert manifest_path.name == "voiceover_manifest.json"
 
         # Verify content
-        with open(manifest_path) as f:
-            data = json.load(f)
+        data = json.loads(manifest_path.read_text())
         assert len(data["scenes"]) == 2
 
-    def test_load_manifest(self, sample_result, tmp_path):
+    def test_load_manifest(self, sample_result):
         """Test loading manifest from file."""
         manifest_path = sample_result.save_manifest()
 
@@ -262,34 +264,36 @@ class TestVoiceoverGenerator:
         assert (tmp_path / "voiceover_manifest.json").exists()
 
 
+LLM_INFERENCE_NARRATIONS = Path("projects/llm-inference/narration/narrations.json")
+LLM_INFERENCE_VOICEOVER_DIR = Path("projects/llm-inference/voiceover")
+LLM_INFERENCE_MANIFEST = LLM_INFERENCE_VOICEOVER_DIR / "manifest.json"
+
+
 class TestLLMInferenceProjectVoiceover:
     """Integration tests for LLM inference project voiceover files."""
 
+    @pytest.mark.skipif(
+        not LLM_INFERENCE_NARRATIONS.exists(), reason="LLM inference project not found"
+    )
     def test_project_narrations_exist(self):
         """Verify narrations file exists in project."""
-        narration_path = Path("projects/llm-inference/narration/narrations.json")
-        if not narration_path.exists():
-            pytest.skip("LLM inference project not found")
-
-        narrations = load_narrations_from_file(narration_path)
+        narrations = load_narrations_from_file(LLM_INFERENCE_NARRATIONS)
         assert len(narrations) == 18
 
+    @pytest.mark.skipif(
+        not LLM_INFERENCE_VOICEOVER_DIR.exists(),
+        reason="LLM inference voiceover directory not found",
+    )
     def test_project_voiceover_files_exist(self):
         """Verify voiceover files exist in project."""
-        voiceover_dir = Path("projects/llm-inference/voiceover")
-        if not voiceover_dir.exists():
-            pytest.skip("LLM inference voiceover directory not found")
-
-        mp3_files = list(voiceover_dir.glob("*.mp3"))
-        assert len(mp3_files) == 18, f"Expected 18 mp3 files, got {len(mp3_files)}"
+        mp3_count = sum(1 for _ in LLM_INFERENCE_VOICEOVER_DIR.glob("*.mp3"))
+        assert mp3_count == 18, f"Expected 18 mp3 files, got {mp3_count}"
 
+    @pytest.mark.skipif(
+        not LLM_INFERENCE_MANIFEST.exists(), reason="LLM inference manifest not found"
+    )
     def test_project_manifest_exists(self):
         """Verify manifest file exists in project."""
-        manifest_path = Path("projects/llm-inference/voiceover/manifest.json")
-        if not manifest_path.exists():
-            pytest.skip("LLM inference manifest not found")
-
-        with open(manifest_path) as f:
-            data = json.load(f)
+        data = json.loads(LLM_INFERENCE_MANIFEST.read_text())
         assert len(data["scenes"]) == 18
         assert data["total_duration_seconds"] > 0